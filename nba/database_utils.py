@@ -1,51 +1,262 @@
 import re
-import json
+import asyncio
+import aiohttp
 
-from pymongo import MongoClient
-from bson import json_util
-from webscrapers import fetch_player_list, get_player_gamelog, get_player_averages
-from typing import Optional, List
+from collections import defaultdict
+from pymongo import MongoClient, UpdateOne, WriteConcern
+from pymongo.collation import Collation
+from pymongo.errors import BulkWriteError
+from pymongo.collection import Collection
+from webscrapers import create_client_session, use_client_session, fetch_player_list, fetch_player_lists_async, get_player_gamelogs_async, get_player_averages_async, scrape_player_async
+from typing import Optional, List, Dict, Tuple, TextIO
+
+# Maximum number of missing game logs buffered in memory before they are flushed to MongoDB
+GAMELOG_BATCH_SIZE = 500
+
+# Case-insensitive collation used to match player names in the game logs
+PLAYER_NAME_COLLATION = Collation(locale='en', strength=2)
+
+# Game log index serving the case-insensitive player name lookups, named so it does not clash with a plain index on
+# the same keys
+PLAYER_NAME_INDEX_KEYS = [("player", 1), ("season", 1)]
+PLAYER_NAME_INDEX = "player_season_ci"
+
+# Players index serving the case-insensitive player name lookups
+PLAYERS_NAME_INDEX = "player_ci"
+
+# Write concern for fire-and-forget writes of scraped data, which is not waited on
+UNACKNOWLEDGED = WriteConcern(w=0)
+
+# MongoDB clients shared across calls, keyed by connection string
+_mongo_clients: Dict[str, MongoClient] = {}
 
 ### Database Helper Methods ###
 
-def store_documents_in_mongodb(documents: list, mongodb_url: str, db_name: str, collection_name: str, unique_properties: List[str]):
+def get_mongo_client(mongodb_url: str) -> MongoClient:
+    """
+    Returns a MongoDB client for the given connection string, creating it on first use. Clients are reused across calls
+    so their connection pool and server discovery are only set up once per process.
+
+    Args:
+        mongodb_url (str): MongoDB connection string (URL) to connect to the MongoDB instance.
+
+    Returns:
+        MongoClient: The shared MongoDB client for the connection string.
+    """
+    if mongodb_url not in _mongo_clients:
+        _mongo_clients[mongodb_url] = MongoClient(mongodb_url, maxPoolSize=50, minPoolSize=5)
+    return _mongo_clients[mongodb_url]
+
+def ensure_indexes(mongodb_url: str):
+    """
+    Creates the indexes backing the game log and player queries and upserts if they do not exist yet, and backfills the
+    lowercase 'player_lc' name of player documents stored without it. Both are idempotent, so this is safe to call on
+    every startup.
+
+    Args:
+        mongodb_url (str): MongoDB connection string (URL) to connect to the MongoDB instance.
+
+    Returns:
+        None
+    """
+    gamelog_collection = get_mongo_client(mongodb_url)["nba_players"]["player_gamelogs"]
+
+    # Unique properties used when storing game logs
+    gamelog_collection.create_index([("player", 1), ("season", 1), ("date_game", 1)])
+    gamelog_collection.create_index([("player_link", 1), ("season", 1)])
+
+    # Case-insensitive player name lookups
+    gamelog_collection.create_index(PLAYER_NAME_INDEX_KEYS, name=PLAYER_NAME_INDEX, collation=PLAYER_NAME_COLLATION)
+
+    players_collection = get_players_collection(mongodb_url)
+
+    # Backfill the lowercase name of player documents stored without it
+    updates = [
+        UpdateOne({"_id": document["_id"]}, {"$set": {"player_lc": document["player"].lower()}})
+        for document in players_collection.find({"player_lc": {"$exists": False}, "player": {"$type": "string"}}, {"player": 1})
+    ]
+    if updates:
+        players_collection.bulk_write(updates, ordered=False)
+
+    # Case-insensitive player name prefix and exact lookups
+    players_collection.create_index("player_lc")
+    players_collection.create_index("player", name=PLAYERS_NAME_INDEX, collation=PLAYER_NAME_COLLATION)
+
+def get_players_collection(mongodb_url: str) -> Collection:
+    """
+    Returns the players collection. Player documents carry a lowercase copy of their name in the indexed 'player_lc'
+    field (see ensure_indexes), so case-insensitive name lookups are served by an index range scan instead of a
+    collection scan with a case-insensitive regex. Exact name lookups use the 'player' index built with
+    PLAYER_NAME_COLLATION.
+
+    Args:
+        mongodb_url (str): MongoDB connection string (URL) to connect to the MongoDB instance.
+
+    Returns:
+        Collection: The players collection.
+    """
+    return get_mongo_client(mongodb_url)["nba_players"]["nba_players"]
+
+def player_name_prefix_query(prefix: str) -> dict:
+    """
+    Builds a query matching the players whose name starts with the given prefix, ignoring case. The query is a range
+    over the indexed 'player_lc' field, e.g. 'b' matches every lowercase name in ['b', 'c').
+
+    Args:
+        prefix (str): The beginning of the player name (e.g. 'b' or 'Kobe Bryant').
+
+    Returns:
+        dict: The MongoDB query for the players collection.
+    """
+    prefix = prefix.lower()
+    return {"player_lc": {"$gte": prefix, "$lt": prefix[:-1] + chr(ord(prefix[-1]) + 1)}}
+
+def player_name_query(player_name: str) -> dict:
+    """
+    Builds a query matching a player by their full name, with or without the Hall of Fame asterisk. Run it with
+    PLAYER_NAME_COLLATION so the match ignores case and is served by the collated 'player' indexes.
+
+    Args:
+        player_name (str): The player's full name (e.g. 'Kobe Bryant').
+
+    Returns:
+        dict: The MongoDB query for the players or game logs collection.
+    """
+    return {"player": {"$in": [player_name, f"{player_name}*"]}}
+
+def store_documents(collection: Collection, documents: list, unique_properties: List[str], fast_insert: bool = False):
     """
     Stores a list of documents into a MongoDB collection, ensuring that duplicates are avoided based on specified unique properties.
+    All documents are written with a single unordered bulk upsert, so one failing document does not abort the batch.
 
     Args:
+        collection (Collection): The MongoDB collection the documents will be inserted into.
         documents (list): A list of dictionaries representing the documents to be inserted into MongoDB.
-        mongodb_url (str): MongoDB connection string (URL) to connect to the MongoDB instance.
-        db_name (str): The name of the database where the documents will be stored.
-        collection_name (str): The name of the collection within the database where the documents will be inserted.
         unique_properties (List[str]): A list of keys that define the uniqueness of each document. The function uses these keys to build a query to check for duplicates.
+        fast_insert (bool, optional): If True, the write is sent unacknowledged (w=0) without waiting for the server, so
+            write errors and insert counts are not reported. Meant for scraped data that can be fetched again. Defaults to False.
 
     Returns:
         None
     """
-    client = MongoClient(mongodb_url)
-    db = client[db_name]
-    collection = db[collection_name]
+    if not documents:
+        return
 
-    for document in documents:
-        print(f"Storing document with unique properties: {unique_properties}")
+    print(f"Storing {len(documents)} documents with unique properties: {unique_properties}")
 
-        # Build the query using the list of unique properties
-        query = {prop: document[prop] for prop in unique_properties if prop in document}
+    # Insert every document whose unique properties are not in the collection yet, leaving existing documents untouched,
+    # in a single unordered round trip
+    operations = [
+        UpdateOne({prop: document[prop] for prop in unique_properties if prop in document}, {"$setOnInsert": document}, upsert=True)
+        for document in documents
+    ]
 
-        try:
-            existing_document = collection.find_one(query)
-        except Exception as e:
-            print(f"Error encountered accessing MongoDB: {str(e)}")
-            existing_document = None
+    if fast_insert:
+        collection = collection.with_options(write_concern=UNACKNOWLEDGED)
 
-        if existing_document:
-            print(f"Document with unique properties {query} found in MongoDB:")
-            print(json.dumps(existing_document, indent=4, default=json_util.default))
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+        if result.acknowledged:
+            print(f"Inserted {result.upserted_count} documents into MongoDB, {result.matched_count} were already stored")
         else:
-            collection.insert_one(document)
-            print(f"Document with unique properties {query} inserted into MongoDB")
+            print(f"Sent {len(operations)} documents to MongoDB without acknowledgement")
+    except BulkWriteError as e:
+        print(f"Error encountered writing to MongoDB: {e.details.get('writeErrors')}")
+
+def store_missing_player_games(collection: Collection, player: dict, seasons: List[str], web_gamelogs: List[List[dict]],
+                               log_file: TextIO) -> int:
+    """
+    Compares a single player's game logs scraped from the website with the ones stored in MongoDB and adds any missing
+    games to the database. Missing games are buffered per player and written once after every season has been checked,
+    flushing early only when the buffer reaches GAMELOG_BATCH_SIZE.
+
+    Args:
+        collection (Collection): The MongoDB collection holding the player game logs.
+        player (dict): The player data containing 'player' and 'link' keys.
+        seasons (List[str]): The seasons the game logs were scraped for.
+        web_gamelogs (List[List[dict]]): The game logs scraped for each season, in the order of the seasons.
+        log_file (TextIO): The open log file missing games are reported to.
 
-def add_missing_games_to_db(mongodb_url: str, player_name: Optional[str] = None, last_initial: Optional[str] = None):
+    Returns:
+        int: The number of missing games added to MongoDB.
+    """
+    total_games_in_db = 0  # Counter for the total number of games found in MongoDB
+    total_games_on_web = 0  # Counter for the total number of games found on the web
+    stored_missing_games = 0  # Counter for the missing games already flushed to MongoDB
+    missing_games = []
+
+    # Load the dates of every stored game of the player in one query, instead of querying MongoDB once per season
+    stored_game_dates = defaultdict(list)
+    for entry in collection.find({"player_link": player['link']}, {"_id": 0, "season": 1, "date_game": 1}):
+        stored_game_dates[entry.get('season')].append(entry.get('date_game'))
+
+    for season, season_gamelogs in zip(seasons, web_gamelogs):
+        db_gamelogs = stored_game_dates[season]
+        db_game_dates = {date_game for date_game in db_gamelogs if date_game is not None}
+
+        total_games_in_db += len(db_gamelogs)  # Update total games in DB for this player
+
+        # Compare the season's game logs and flush missing games in fixed-size batches
+        for game in season_gamelogs:
+            total_games_on_web += 1  # Update total games found on the web for this player
+            if game['date_game'] not in db_game_dates:
+                log_file.write(f"Missing game: Player: {player['player']}, Season: {season}, Date: {game['date_game']}\n")
+                missing_games.append(game)
+                if len(missing_games) >= GAMELOG_BATCH_SIZE:
+                    store_documents(collection, missing_games, ["player", "season", "date_game"], fast_insert=True)
+                    stored_missing_games += len(missing_games)
+                    missing_games.clear()
+
+    # Output total games found in MongoDB and on the web
+    print(f"Total number of games found in MongoDB for player '{player['player']}': {total_games_in_db}")
+    print(f"Total number of games found on the web for player '{player['player']}': {total_games_on_web}")
+    log_file.write(f"Total number of games found in MongoDB for player '{player['player']}': {total_games_in_db}\n")
+    log_file.write(f"Total number of games found on the web for player '{player['player']}': {total_games_on_web}\n")
+
+    # Output missing games if there's a difference between web and MongoDB
+    if total_games_in_db != total_games_on_web:
+        total_missing_games = total_games_on_web - total_games_in_db
+        if total_missing_games != stored_missing_games + len(missing_games):
+            print("ERROR: total missing games counts do NOT match!")
+        print(f"Total missing games for player '{player['player']}': {total_missing_games}")
+        log_file.write(f"Total missing games for player '{player['player']}': {total_missing_games}\n")
+
+    # Store the remaining missing games once for the whole player
+    if missing_games:
+        store_documents(collection, missing_games, ["player", "season", "date_game"], fast_insert=True)
+        stored_missing_games += len(missing_games)
+
+    if stored_missing_games:
+        print(f"Added {stored_missing_games} missing games for player '{player['player']}' to MongoDB.")
+    else:
+        print(f"No missing games found for player: {player['player']}\n")
+        log_file.write(f"No missing games found for player: {player['player']}\n")
+
+    return stored_missing_games
+
+async def add_missing_player_games(collection: Collection, player: dict, log_file: TextIO,
+                                   session: Optional[aiohttp.ClientSession] = None) -> int:
+    """
+    Fetches a single player's game logs from the website and adds the games missing from MongoDB to the database. See
+    store_missing_player_games.
+
+    Args:
+        collection (Collection): The MongoDB collection holding the player game logs.
+        player (dict): The player data containing 'player', 'link', 'year_min' and 'year_max' keys.
+        log_file (TextIO): The open log file missing games are reported to.
+        session (Optional[aiohttp.ClientSession], optional): The HTTP session to reuse, so a scan of many players keeps
+            its connections to Basketball Reference open. Defaults to a new session.
+
+    Returns:
+        int: The number of missing games added to MongoDB.
+    """
+    seasons = [str(year) for year in range(int(player['year_min']), int(player['year_max']) + 1)]
+
+    # Fetch every season's game logs concurrently, the requests are I/O bound and independent of each other
+    web_gamelogs = await get_player_gamelogs_async(player['player'], player['link'], seasons, session)
+    return store_missing_player_games(collection, player, seasons, web_gamelogs, log_file)
+
+def add_missing_games_to_db(mongodb_url: str, player_name: Optional[str] = None, last_initial: Optional[str] = None) -> int:
     """
     Find and log missing game entries for players by comparing website data and MongoDB data. If missing game logs
     are found, they will be added to the database. Outputs the total number of games found in MongoDB, in the web logs,
@@ -55,11 +266,14 @@ def add_missing_games_to_db(mongodb_url: str, player_name: Optional[str] = None,
         mongodb_url (str): MongoDB connection string.
         player_name (Optional[str]): The full name of the player to check.
         last_initial (Optional[str]): The initial of the player's last name (A-Z).
+
+    Returns:
+        int: The total number of missing games added to MongoDB.
     """
-    client = MongoClient(mongodb_url)
+    client = get_mongo_client(mongodb_url)
     db = client["nba_players"]
     collection = db["player_gamelogs"]
-    missing_games = []
+    total_added_games = 0
 
     with open("missed_games.log", "a") as log_file:
         if player_name:
@@ -72,111 +286,133 @@ def add_missing_games_to_db(mongodb_url: str, player_name: Optional[str] = None,
                 if player['player'].lower() == player_name.lower():
                     print(f"Found player: {player['player']}")
                     log_file.write(f"Found player: {player['player']}\n")
-
-                    total_games_in_db = 0  # Counter for the total number of games found in MongoDB
-                    total_games_on_web = 0  # Counter for the total number of games found on the web
-
-                    for year in range(int(player['year_min']), int(player['year_max']) + 1):
-                        season = str(year)
-                        web_gamelogs = get_player_gamelog(player['player'], player['link'], season)
-                        db_gamelogs = list(collection.find({"player_link": player['link'], "season": season}))
-                        db_game_dates = {entry['date_game'] for entry in db_gamelogs if 'date_game' in entry}
-
-                        total_games_in_db += len(db_gamelogs)  # Update total games in DB for this player
-                        total_games_on_web += len(web_gamelogs)  # Update total games found on the web for this player
-
-                        for game in web_gamelogs:
-                            if game['date_game'] not in db_game_dates:
-                                log_file.write(f"Missing game: Player: {player['player']}, Season: {season}, Date: {game['date_game']}\n")
-                                missing_games.append(game)
-                    
-                    # Output total games found in MongoDB and on the web
-                    print(f"Total number of games found in MongoDB for player {player_name}: {total_games_in_db}")
-                    print(f"Total number of games found on the web for player {player_name}: {total_games_on_web}")
-                    log_file.write(f"Total number of games found in MongoDB for player {player_name}: {total_games_in_db}\n")
-                    log_file.write(f"Total number of games found on the web for player {player_name}: {total_games_on_web}\n")
-
-                    # Output missing games if there's a difference between web and MongoDB
-                    if total_games_in_db != total_games_on_web:
-                        total_missing_games = total_games_on_web - total_games_in_db
-                        if total_missing_games != len(missing_games):
-                            print("ERROR: total missing games counts do NOT match!")
-                        print(f"Total missing games for player '{player['player']}': {total_missing_games}")
-                        log_file.write(f"Total missing games for player {player_name}: {total_missing_games}\n")
-                        print(f"Missing games count: {len(missing_games)}")
-                        store_documents_in_mongodb(missing_games, mongodb_url, "nba_players", "player_gamelogs", ["player", "season", "date_game"])
-                        print(f"Added {len(missing_games)} missing games for player '{player['player']}' to MongoDB.")
-                        missing_games.clear()
-                    else:
-                        print(f"No missing games found for player: {player['player']}\n")
-                        log_file.write(f"No missing games found for player: {player['player']}\n")
+                    total_added_games += asyncio.run(add_missing_player_games(collection, player, log_file))
                     break
             else:
                 print(f"Player {player_name} not found.")
                 log_file.write(f"Player {player_name} not found.\n")
         else:
             initials = [last_initial.lower()] if last_initial else [chr(i) for i in range(ord('a'), ord('z') + 1)]
+            total_added_games += asyncio.run(add_missing_initials_games(collection, initials, log_file))
+
+    return total_added_games
 
-            for initial in initials:
-                print(f"Scanning players with last name starting with '{initial.upper()}'")
-                players = fetch_player_list(initial)
-
-                for player in players:
-                    total_games_in_db = 0  # Counter for the total number of games found in MongoDB
-                    total_games_on_web = 0  # Counter for the total number of games found on the web
-
-                    for year in range(int(player['year_min']), int(player['year_max']) + 1):
-                        season = str(year)
-                        web_gamelogs = get_player_gamelog(player['player'], player['link'], season)
-                        db_gamelogs = list(collection.find({"player_link": player['link'], "season": season}))
-                        db_game_dates = {entry['date_game'] for entry in db_gamelogs if 'date_game' in entry}
-
-                        total_games_in_db += len(db_gamelogs)  # Update total games in DB for this player
-                        total_games_on_web += len(web_gamelogs)  # Update total games found on the web for this player
-
-                        for game in web_gamelogs:
-                            if game['date_game'] not in db_game_dates:
-                                log_file.write(f"Missing game: Player: {player['player']}, Season: {season}, Date: {game['date_game']}\n")
-                                missing_games.append(game)
-
-                    # Output total games found in MongoDB and on the web
-                    print(f"Total number of games found in MongoDB for player '{player['player']}': {total_games_in_db}")
-                    print(f"Total number of games found on the web for player '{player['player']}': {total_games_on_web}")
-                    log_file.write(f"Total number of games found in MongoDB for player '{player['player']}': {total_games_in_db}\n")
-                    log_file.write(f"Total number of games found on the web for player '{player['player']}': {total_games_on_web}\n")
-
-                    # Output missing games if there's a difference between web and MongoDB
-                    if total_games_in_db != total_games_on_web:
-                        total_missing_games = total_games_on_web - total_games_in_db
-                        if total_missing_games != len(missing_games):
-                            print("ERROR: total missing games do NOT match!")
-                        print(f"Total missing games for player '{player['player']}': {total_missing_games}")
-                        log_file.write(f"Total missing games for player {player_name}: {total_missing_games}\n")
-                        print(f"Missing games count: {len(missing_games)}")
-                        store_documents_in_mongodb(missing_games, mongodb_url, "nba_players", "player_gamelogs", ["player", "season", "date_game"])
-                        print(f"Added {len(missing_games)} missing games for player: '{player['player']}' to MongoDB.")
-                        missing_games.clear()
-                    else:
-                        print(f"No missing games found for player: {player['player']}\n")
-                        log_file.write(f"No missing games found for player: {player['player']}\n")
-
-    return missing_games
-
-def add_missing_averages_to_db(mongodb_url: str, player_name: Optional[str] = None, last_initial: Optional[str] = None):
+async def add_missing_initials_games(collection: Collection, initials: List[str], log_file: TextIO) -> int:
     """
-    Find and log missing game entries for players by comparing website data and MongoDB data. If missing game logs
-    are found, they will be added to the database. Outputs the total number of games found in MongoDB, in the web logs,
-    and if there are missing games, outputs the total number of missing games and logs each missed game.
+    Adds the missing games of every player whose last name starts with one of the given initials. The whole scan runs
+    on one event loop and one HTTP session, so connections to Basketball Reference are reused from player to player.
+    Players are checked one after the other, so only a single player's game logs are held in memory at a time.
+
+    Args:
+        collection (Collection): The MongoDB collection holding the player game logs.
+        initials (List[str]): The first letters of the players' last names.
+        log_file (TextIO): The open log file missing games are reported to.
+
+    Returns:
+        int: The number of missing games added to MongoDB.
+    """
+    total_added_games = 0
+
+    async with create_client_session() as session:
+        # Fetch the player lists for every initial concurrently
+        player_lists = await fetch_player_lists_async(initials, session)
+
+        for initial, players in zip(initials, player_lists):
+            print(f"Scanning players with last name starting with '{initial.upper()}'")
+
+            for player in players:
+                total_added_games += await add_missing_player_games(collection, player, log_file, session)
+
+    return total_added_games
+
+def store_missing_player_averages(collection: Collection, player: dict, web_avgs: List[dict], log_file: TextIO) -> int:
+    """
+    Compares a single player's season averages scraped from the website with the ones stored in MongoDB and adds any
+    missing averages to the database.
+
+    Args:
+        collection (Collection): The MongoDB collection holding the player averages.
+        player (dict): The player data containing a 'player' key.
+        web_avgs (List[dict]): The player's season averages scraped from the website.
+        log_file (TextIO): The open log file missing averages are reported to.
+
+    Returns:
+        int: The number of missing averages added to MongoDB.
+    """
+    total_avgs_in_db = 0  # Counter for the total number of averages found in MongoDB
+    total_avgs_on_web = len(web_avgs)  # Counter for the total number of averages found on the web
+    missing_averages = []
+
+    for avg in web_avgs:
+        db_avg = list(collection.find({"player_link": avg['player_link'], "type": avg['type'], "season": avg["season"], "playoffs": avg["playoffs"], 'team_id': avg["team_id"], 'lg_id': avg["lg_id"]}))
+        if not db_avg:
+            print(f"Missing avg: Player: {avg['player']}, Season: {avg['season']}, Playoffs: {avg['playoffs']}\n")
+            missing_averages.append(avg)
+        else:
+            print(f"Player average stats found: Player: {avg['player']}, Season: {avg['season']}, Playoffs: {avg['playoffs']}\n")
+            total_avgs_in_db += 1
+
+    # Output total averages found in MongoDB and on the web
+    print(f"Total number of averages found in MongoDB for player {player['player']}: {total_avgs_in_db}")
+    print(f"Total number of averages found on the web for player {player['player']}: {total_avgs_on_web}")
+    log_file.write(f"Total number of averages found in MongoDB for player {player['player']}: {total_avgs_in_db}\n")
+    log_file.write(f"Total number of averages found on the web for player {player['player']}: {total_avgs_on_web}\n")
+
+    # Output and store missing averages if there's a difference between web and MongoDB
+    if total_avgs_in_db != total_avgs_on_web:
+        total_missing_avgs = total_avgs_on_web - total_avgs_in_db
+        if total_missing_avgs != len(missing_averages):
+            print("ERROR: total missing averages counts do NOT match!")
+        print(f"Total missing averages for player '{player['player']}': {total_missing_avgs}")
+        log_file.write(f"Total missing averages for player {player['player']}: {total_missing_avgs}\n")
+        print(f"Missing averages count: {len(missing_averages)}")
+
+        store_documents(collection, missing_averages, ["player", "type", "season", "playoffs", "team_id", "lg_id"])
+        print(f"Added {len(missing_averages)} missing averages for player '{player['player']}' to MongoDB.")
+    else:
+        print(f"No missing averages found for player: {player['player']}\n")
+        log_file.write(f"No missing averages found for player: {player['player']}\n")
+
+    return len(missing_averages)
+
+async def add_missing_player_averages(collection: Collection, player: dict, log_file: TextIO,
+                                      session: Optional[aiohttp.ClientSession] = None) -> int:
+    """
+    Fetches a single player's season averages from the website and adds the ones missing from MongoDB to the database.
+    See store_missing_player_averages.
+
+    Args:
+        collection (Collection): The MongoDB collection holding the player averages.
+        player (dict): The player data containing 'player' and 'link' keys.
+        log_file (TextIO): The open log file missing averages are reported to.
+        session (Optional[aiohttp.ClientSession], optional): The HTTP session to reuse, so a scan of many players keeps
+            its connections to Basketball Reference open. Defaults to a new session.
+
+    Returns:
+        int: The number of missing averages added to MongoDB.
+    """
+    async with use_client_session(session) as session:
+        web_avgs = await get_player_averages_async(session, player['player'], player['link'])
+    return store_missing_player_averages(collection, player, web_avgs, log_file)
+
+def add_missing_averages_to_db(mongodb_url: str, player_name: Optional[str] = None, last_initial: Optional[str] = None) -> int:
+    """
+    Find and log missing season averages for players by comparing website data and MongoDB data. If missing averages
+    are found, they will be added to the database. Outputs the total number of averages found in MongoDB, on the web,
+    and if there are missing averages, outputs the total number of missing averages and logs each missed average.
 
     Args:
         mongodb_url (str): MongoDB connection string.
         player_name (Optional[str]): The full name of the player to check.
         last_initial (Optional[str]): The initial of the player's last name (A-Z).
+
+    Returns:
+        int: The total number of missing averages added to MongoDB.
     """
-    client = MongoClient(mongodb_url)
+    client = get_mongo_client(mongodb_url)
     db = client["nba_players"]
     collection = db["player_averages"]
-    missing_averages = []
+    total_added_averages = 0
 
     with open("missed_avgs.log", "a") as log_file:
         if player_name:
@@ -189,92 +425,144 @@ def add_missing_averages_to_db(mongodb_url: str, player_name: Optional[str] = No
                 if player['player'].lower() == player_name.lower():
                     print(f"Found player: {player['player']}")
                     log_file.write(f"Found player: {player['player']}\n")
-
-                    total_avgs_in_db = 0  # Counter for the total number of averages found in MongoDB
-                    total_avgs_on_web = 0  # Counter for the total number of averages found on the web
-
-                    web_avgs = get_player_averages(player['player'], player['link'])
-                    total_avgs_on_web += len(web_avgs)  # Update total games found on the web for this player
-                    for avg in web_avgs:
-                        db_avg = list(collection.find({"player_link": avg['player_link'], "type": avg['type'], "season": avg["season"], "playoffs": avg["playoffs"], 'team_id': avg["team_id"], 'lg_id': avg["lg_id"]}))
-                        if not db_avg:
-                            print(f"Missing avg: Player: {avg['player']}, Season: {avg['season']}, Playoffs: {avg['playoffs']}\n")
-                            missing_averages.append(avg)
-                        else:
-                            print(f"Player average stats found: Player: {avg['player']}, Season: {avg['season']}, Playoffs: {avg['playoffs']}\n")
-                            total_avgs_in_db += 1
-                    
-                    # Output total games found in MongoDB and on the web
-                    print(f"Total number of averages found in MongoDB for player {player_name}: {total_avgs_in_db}")
-                    print(f"Total number of averages found on the web for player {player_name}: {total_avgs_on_web}")
-                    log_file.write(f"Total number of averages found in MongoDB for player {player_name}: {total_avgs_in_db}\n")
-                    log_file.write(f"Total number of averages found on the web for player {player_name}: {total_avgs_on_web}\n")
-
-                    # Output missing gaverages if there's a difference between web and MongoDB
-                    if total_avgs_in_db != total_avgs_on_web:
-                        total_missing_avgs = total_avgs_on_web - total_avgs_in_db
-                        if total_missing_avgs != len(missing_averages):
-                            print("ERROR: total missing averages counts do NOT match!")
-                        print(f"Total missing averages for player '{player['player']}': {total_missing_avgs}")
-                        log_file.write(f"Total missing averages for player {player_name}: {total_missing_avgs}\n")
-                        print(f"Missing averages count: {len(missing_averages)}")
-                        
-                        store_documents_in_mongodb(missing_averages, mongodb_url, "nba_players", "player_averages", ["player", "type", "season", "playoffs", "team_id", "lg_id"])
-                        print(f"Added {len(missing_averages)} missing averages for player '{player['player']}' to MongoDB.")
-                        missing_averages.clear()
-                    else:
-                        print(f"No missing averages found for player: {player['player']}\n")
-                        log_file.write(f"No missing averages found for player: {player['player']}\n")
-                    
+                    total_added_averages += asyncio.run(add_missing_player_averages(collection, player, log_file))
                     break
             else:
                 print(f"Player {player_name} not found.")
                 log_file.write(f"Player {player_name} not found.\n")
         else:
             initials = [last_initial.lower()] if last_initial else [chr(i) for i in range(ord('a'), ord('z') + 1)]
+            total_added_averages += asyncio.run(add_missing_initials_averages(collection, initials, log_file))
+
+    return total_added_averages
+
+async def add_missing_initials_averages(collection: Collection, initials: List[str], log_file: TextIO) -> int:
+    """
+    Adds the missing season averages of every player whose last name starts with one of the given initials. Like
+    add_missing_initials_games, the whole scan runs on one event loop and one HTTP session, and each player's averages
+    are compared and stored before the next player is fetched.
+
+    Args:
+        collection (Collection): The MongoDB collection holding the player averages.
+        initials (List[str]): The first letters of the players' last names.
+        log_file (TextIO): The open log file missing averages are reported to.
+
+    Returns:
+        int: The number of missing averages added to MongoDB.
+    """
+    total_added_averages = 0
 
-            for initial in initials:
-                print(f"Scanning players with last name starting with '{initial.upper()}'")
-                players = fetch_player_list(initial)
-
-                for player in players:
-                    total_avgs_in_db = 0  # Counter for the total number of averages found in MongoDB
-                    total_avgs_on_web = 0  # Counter for the total number of averages found on the web
-
-                    web_avgs = get_player_averages(player['player'], player['link'])
-                    total_avgs_on_web += len(web_avgs)  # Update total games found on the web for this player
-                    for avg in web_avgs:
-                        db_avg = list(collection.find({"player_link": avg['player_link'], "type": avg['type'], "season": avg["season"], "playoffs": avg["playoffs"], 'team_id': avg["team_id"], 'lg_id': avg["lg_id"]}))
-                        if not db_avg:
-                            print(f"Missing avg: Player: {avg['player']}, Season: {avg['season']}, Playoffs: {avg['playoffs']}\n")
-                            missing_averages.append(avg)
-                        else:
-                            print(f"Player average stats found: Player: {avg['player']}, Season: {avg['season']}, Playoffs: {avg['playoffs']}\n")
-                            total_avgs_in_db += 1
-
-                    # Output total games found in MongoDB and on the web
-                    print(f"Total number of averages found in MongoDB for player {player_name}: {total_avgs_in_db}")
-                    print(f"Total number of averages found on the web for player {player_name}: {total_avgs_on_web}")
-                    log_file.write(f"Total number of averages found in MongoDB for player {player_name}: {total_avgs_in_db}\n")
-                    log_file.write(f"Total number of averages found on the web for player {player_name}: {total_avgs_on_web}\n")
-
-                    # Output missing gaverages if there's a difference between web and MongoDB
-                    if total_avgs_in_db != total_avgs_on_web:
-                        total_missing_avgs = total_avgs_on_web - total_avgs_in_db
-                        if total_missing_avgs != len(missing_averages):
-                            print("ERROR: total missing averages counts do NOT match!")
-                        print(f"Total missing averages for player '{player['player']}': {total_missing_avgs}")
-                        log_file.write(f"Total missing averages for player {player_name}: {total_missing_avgs}\n")
-                        print(f"Missing averages count: {len(missing_averages)}")
-                        
-                        store_documents_in_mongodb(missing_averages, mongodb_url, "nba_players", "player_averages", ["player", "type", "season", "playoffs", "team_id", "lg_id"])
-                        print(f"Added {len(missing_averages)} missing averages for player '{player['player']}' to MongoDB.")
-                        missing_averages.clear()
-                    else:
-                        print(f"No missing averages found for player: {player['player']}\n")
-                        log_file.write(f"No missing averages found for player: {player['player']}\n")
-
-    return missing_averages
+    async with create_client_session() as session:
+        # Fetch the player lists for every initial concurrently
+        player_lists = await fetch_player_lists_async(initials, session)
+
+        for initial, players in zip(initials, player_lists):
+            print(f"Scanning players with last name starting with '{initial.upper()}'")
+
+            for player in players:
+                total_added_averages += await add_missing_player_averages(collection, player, log_file, session)
+
+    return total_added_averages
+
+async def add_missing_player_data(gamelog_collection: Collection, averages_collection: Collection, player: dict,
+                                  games_log_file: TextIO, averages_log_file: TextIO,
+                                  session: Optional[aiohttp.ClientSession] = None) -> Tuple[int, int]:
+    """
+    Checks a single player's game logs and season averages in one pass. The player page and every game log page are
+    fetched concurrently, then the games and averages missing from MongoDB are added to the database. See
+    store_missing_player_games and store_missing_player_averages.
+
+    Args:
+        gamelog_collection (Collection): The MongoDB collection holding the player game logs.
+        averages_collection (Collection): The MongoDB collection holding the player averages.
+        player (dict): The player data containing 'player', 'link', 'year_min' and 'year_max' keys.
+        games_log_file (TextIO): The open log file missing games are reported to.
+        averages_log_file (TextIO): The open log file missing averages are reported to.
+        session (Optional[aiohttp.ClientSession], optional): The HTTP session to reuse, so a scan of many players keeps
+            its connections to Basketball Reference open. Defaults to a new session.
+
+    Returns:
+        Tuple[int, int]: The number of missing games and of missing averages added to MongoDB.
+    """
+    seasons = [str(year) for year in range(int(player['year_min']), int(player['year_max']) + 1)]
+    web_avgs, web_gamelogs = await scrape_player_async(player, session)
+
+    added_games = store_missing_player_games(gamelog_collection, player, seasons, web_gamelogs, games_log_file)
+    added_averages = store_missing_player_averages(averages_collection, player, web_avgs, averages_log_file)
+    return added_games, added_averages
+
+def add_missing_data_to_db(mongodb_url: str, player_name: Optional[str] = None, last_initial: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Find and log missing game logs and season averages for players by comparing website data and MongoDB data, fetching
+    each player's pages once for both checks. Missing entries are added to the database. See add_missing_games_to_db
+    and add_missing_averages_to_db.
+
+    Args:
+        mongodb_url (str): MongoDB connection string.
+        player_name (Optional[str]): The full name of the player to check.
+        last_initial (Optional[str]): The initial of the player's last name (A-Z).
+
+    Returns:
+        Tuple[int, int]: The total number of missing games and of missing averages added to MongoDB.
+    """
+    client = get_mongo_client(mongodb_url)
+    db = client["nba_players"]
+    gamelog_collection = db["player_gamelogs"]
+    averages_collection = db["player_averages"]
+    total_added = (0, 0)
+
+    with open("missed_games.log", "a") as games_log_file, open("missed_avgs.log", "a") as averages_log_file:
+        if player_name:
+            last_name_initial = player_name.split()[-1][0].lower()
+            print(f"Searching for player: {player_name} (last name initial '{last_name_initial}')")
+            players = fetch_player_list(last_name_initial)
+
+            for player in players:
+                if player['player'].lower() == player_name.lower():
+                    print(f"Found player: {player['player']}")
+                    total_added = asyncio.run(add_missing_player_data(gamelog_collection, averages_collection, player, games_log_file, averages_log_file))
+                    break
+            else:
+                print(f"Player {player_name} not found.")
+        else:
+            initials = [last_initial.lower()] if last_initial else [chr(i) for i in range(ord('a'), ord('z') + 1)]
+            total_added = asyncio.run(add_missing_initials_data(gamelog_collection, averages_collection, initials, games_log_file, averages_log_file))
+
+    return total_added
+
+async def add_missing_initials_data(gamelog_collection: Collection, averages_collection: Collection, initials: List[str],
+                                    games_log_file: TextIO, averages_log_file: TextIO) -> Tuple[int, int]:
+    """
+    Adds the missing game logs and season averages of every player whose last name starts with one of the given
+    initials. Like add_missing_initials_games, the whole scan runs on one event loop and one HTTP session, and each
+    player is compared and stored before the next player is fetched.
+
+    Args:
+        gamelog_collection (Collection): The MongoDB collection holding the player game logs.
+        averages_collection (Collection): The MongoDB collection holding the player averages.
+        initials (List[str]): The first letters of the players' last names.
+        games_log_file (TextIO): The open log file missing games are reported to.
+        averages_log_file (TextIO): The open log file missing averages are reported to.
+
+    Returns:
+        Tuple[int, int]: The number of missing games and of missing averages added to MongoDB.
+    """
+    total_added_games = 0
+    total_added_averages = 0
+
+    async with create_client_session() as session:
+        # Fetch the player lists for every initial concurrently
+        player_lists = await fetch_player_lists_async(initials, session)
+
+        for initial, players in zip(initials, player_lists):
+            print(f"Scanning players with last name starting with '{initial.upper()}'")
+
+            for player in players:
+                added_games, added_averages = await add_missing_player_data(gamelog_collection, averages_collection, player, games_log_file, averages_log_file, session)
+                total_added_games += added_games
+                total_added_averages += added_averages
+
+    return total_added_games, total_added_averages
 
 def handle_missing_players(mongodb_url: str, check_missing_players: Optional[str]):
     """
@@ -336,6 +624,37 @@ def handle_missing_player_averages(mongodb_url: str, check_missing_averages: Opt
     # Handle specific player name (e.g., 'Kobe Bryant')
     add_missing_averages_to_db(mongodb_url, player_name=check_missing_averages)
 
+def handle_missing_player_data(mongodb_url: str, check_missing_data: Optional[str]):
+    """
+    Processes the 'check_missing_data' input and checks the game logs and season averages of the given players,
+    initials or ranges of initials in one pass. See add_missing_data_to_db.
+
+    Args:
+        mongodb_url (str): MongoDB connection string.
+        check_missing_data (Optional[str]): Input string to specify the players or initials to check.
+    """
+
+    if re.match(r'^([a-zA-Z])-([a-zA-Z])$', check_missing_data):
+        # Handle range of initials (e.g., 'a-c')
+        start, end = check_missing_data.split('-')
+        initials = [chr(i) for i in range(ord(start.lower()), ord(end.lower()) + 1)]
+        for initial in initials:
+            add_missing_data_to_db(mongodb_url, last_initial=initial)
+
+    elif ',' in check_missing_data:
+        # Handle comma-separated list of player names (e.g., 'Kobe Bryant, Paul Pierce')
+        player_names = check_missing_data.split(',')
+        for player_name in player_names:
+            add_missing_data_to_db(mongodb_url, player_name=player_name.strip())
+
+    elif re.match(r'^[a-zA-Z]$', check_missing_data):
+        # Handle single initial (e.g., 'b')
+        add_missing_data_to_db(mongodb_url, last_initial=check_missing_data.lower())
+
+    else:
+        # Handle specific player name (e.g., 'Kobe Bryant')
+        add_missing_data_to_db(mongodb_url, player_name=check_missing_data)
+
 def handle_gamelog_name_add(mongodb_url: str, players_input: Optional[str] = None):
     """
     Adds player names to the gamelogs based on input provided for players or initials.
@@ -344,32 +663,31 @@ def handle_gamelog_name_add(mongodb_url: str, players_input: Optional[str] = Non
         mongodb_url (str): MongoDB connection string.
         players_input (Optional[str]): Input for players or initials to check (e.g. 'Kobe Bryant', 'a-c', 'b').
     """
-    client = MongoClient(mongodb_url)
-    db = client["nba_players"]
-    players_collection = db["nba_players"]
+    client = get_mongo_client(mongodb_url)
+    players_collection = get_players_collection(mongodb_url)
 
     if re.match(r'^([a-zA-Z])-([a-zA-Z])$', players_input):
         # Handle range of initials (e.g., 'a-c')
         start, end = players_input.split('-')
         initials = [chr(i) for i in range(ord(start.lower()), ord(end.lower()) + 1)]
         for initial in initials:
-            players = players_collection.find({"player": {"$regex": f"^{initial}", "$options": "i"}})
+            players = players_collection.find(player_name_prefix_query(initial))
             process_player_gamelogs(client, players)
 
     elif ',' in players_input:
         # Handle comma-separated list of player names (e.g., 'Kobe Bryant, Paul Pierce')
         player_names = players_input.split(',')
         for player_name in player_names:
-            players = players_collection.find({"player": player_name.strip()})
+            players = players_collection.find(player_name_query(player_name.strip()), collation=PLAYER_NAME_COLLATION)
             process_player_gamelogs(client, players)
 
     elif re.match(r'^[a-zA-Z]$', players_input):
         # Handle single initial (e.g., 'b')
-        players = players_collection.find({"player": {"$regex": f"^{players_input}", "$options": "i"}})
+        players = players_collection.find(player_name_prefix_query(players_input))
         process_player_gamelogs(client, players)
 
     # Handle specific player name (e.g., 'Kobe Bryant')
-    players = players_collection.find({"player": players_input})
+    players = players_collection.find(player_name_query(players_input), collation=PLAYER_NAME_COLLATION)
     process_player_gamelogs(client, players)
 
 def process_player_gamelogs(client: MongoClient, player_data: List[dict]):
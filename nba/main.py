@@ -1,12 +1,10 @@
 import argparse
-import requests
+import asyncio
 from typing import Optional, List
-from pymongo import MongoClient
 import re
 
-from utilities import get_stat_value, get_soup, convert_height_to_inches
-from database_utils import handle_missing_players, handle_gamelog_name_add, store_documents_in_mongodb, handle_missing_player_averages
-from webscrapers import get_player_gamelog, get_player_averages
+from database_utils import handle_missing_players, handle_gamelog_name_add, store_documents, handle_missing_player_averages, handle_missing_player_data, get_mongo_client, get_players_collection, player_name_prefix_query, player_name_query, ensure_indexes, PLAYER_NAME_COLLATION, PLAYER_NAME_INDEX
+from webscrapers import get_player_gamelog, get_player_gamelogs_async, get_player_averages, fetch_player_list as scrape_player_list, fetch_player_lists_async
 
 def fetch_player_list(players_input: str, mongodb_url: Optional[str] = None) -> List[dict]:
     """
@@ -23,9 +21,6 @@ def fetch_player_list(players_input: str, mongodb_url: Optional[str] = None) ->
     Returns:
         List[dict]: A list of dictionaries containing player data.
     """
-    base_url = 'https://www.basketball-reference.com/players/'
-    players = []
-
     if re.match(r'^([a-zA-Z])-([a-zA-Z])$', players_input):
         # Handle range of initials (e.g., 'a-c')
         start, end = players_input.split('-')
@@ -42,11 +37,7 @@ def fetch_player_list(players_input: str, mongodb_url: Optional[str] = None) ->
         return fetch_players_by_name([players_input], mongodb_url)
 
     # Fetch players based on initials
-    for initial in initials:
-        url = f'{base_url}{initial}/'
-        players.extend(fetch_players_by_initial(url, initial, mongodb_url=mongodb_url))
-
-    return players
+    return fetch_players_by_initials(initials, mongodb_url=mongodb_url)
 
 
 def fetch_players_by_name(player_names: List[str], mongodb_url: Optional[str] = None) -> List[dict]:
@@ -61,17 +52,14 @@ def fetch_players_by_name(player_names: List[str], mongodb_url: Optional[str] =
         List[dict]: A list of dictionaries containing player data.
     """
     players = []
-    base_url = 'https://www.basketball-reference.com/players/'
 
     if mongodb_url:
         try:
-            client = MongoClient(mongodb_url)
-            db = client["nba_players"]
-            players_collection = db["nba_players"]
+            players_collection = get_players_collection(mongodb_url)
 
             for player_name in player_names:
-                # Use a regex to match player names even if the MongoDB entry contains extra characters like an asterisk
-                mongo_players = list(players_collection.find({"player": {"$regex": f"^{player_name.strip()}", "$options": "i"}}, {"_id": 0}))
+                # Use a prefix match on the player names even if the MongoDB entry contains extra characters like an asterisk
+                mongo_players = list(players_collection.find(player_name_prefix_query(player_name.strip()), {"_id": 0, "player_lc": 0}))
                 if mongo_players:
                     print(f"Player '{player_name.strip()}' found in MongoDB")
                     players.extend(mongo_players)
@@ -80,115 +68,55 @@ def fetch_players_by_name(player_names: List[str], mongodb_url: Optional[str] =
         except Exception as e:
             print(f"Error querying MongoDB: {e}")
 
-    # Fetch from web if not found in MongoDB
+    # Fetch from web if not found in MongoDB, loading each initial's player list only once
+    player_lists = {}
     for player_name in player_names:
         player_name = player_name.strip()
         initial = player_name.split()[-1][0].lower()
-        url = f'{base_url}{initial}/'
-        try:
+        if initial not in player_lists:
             print(f"Fetching players from web for initial '{initial}'")
-            response = requests.get(url)
-            page_soup = get_soup(response)
-            table_rows = page_soup.find('tbody').find_all('tr')
-
-            for row in table_rows:
-                name = row.find('th', {'data-stat': 'player'}).text.encode('latin1').decode('utf-8')
-                if player_name not in name:
-                    continue
-
-                data = {
-                    'player': player_name,
-                    'link': row.find('a').get('href').replace('.html', ''),
-                    'year_min': get_stat_value(row, 'year_min'),
-                    'year_max': get_stat_value(row, 'year_max'),
-                    'pos': get_stat_value(row, 'pos'),
-                    'height': get_stat_value(row, 'height'),
-                    'height_inches': convert_height_to_inches(get_stat_value(row, 'height')) if get_stat_value(row, 'height') else None,
-                    'weight': get_stat_value(row, 'weight'),
-                    'birth_date': get_stat_value(row, 'birth_date'),
-                    'colleges': get_stat_value(row, 'colleges')
-                }
-
-                college_element = get_stat_value(row, 'colleges', is_text=False)
-                if college_element:
-                    try:
-                        data['college_link'] = college_element.find('a').get('href')
-                    except AttributeError:
-                        print(f"College link not found for {data['player']}")
-                players.append(data)
+            player_lists[initial] = scrape_player_list(initial)
+
+        players.extend({**data, 'player': player_name} for data in player_lists[initial] if player_name in data['player'])
 
-        except Exception as e:
-            print(f"Error encountered while fetching {url}: {e}")
-            return []
-        
     return players
 
 
-def fetch_players_by_initial(url: str, initial: str, mongodb_url: Optional[str] = None) -> List[dict]:
+def fetch_players_by_initials(initials: List[str], mongodb_url: Optional[str] = None) -> List[dict]:
     """
-    Fetches players whose last names start with the given initial or matches a specific player name.
-    It first checks the MongoDB database (if `mongodb_url` is provided) before making a web request.
+    Fetches players whose last names start with one of the given initials.
+    It first checks the MongoDB database (if `mongodb_url` is provided) for each initial, then fetches the player lists
+    of the initials missing from the database concurrently.
 
     Args:
-        url (str): The URL to fetch players by initial.
-        specific_name (Optional[str]): Specific player name to search for.
+        initials (List[str]): The first letters of the players' last names.
         mongodb_url (Optional[str]): MongoDB connection string for checking the database.
 
     Returns:
-        List[dict]: A list of dictionaries containing player data.
+        List[dict]: A list of dictionaries containing player data, grouped by initial in the given order.
     """
-    players = []
+    players_by_initial = {}
 
     if mongodb_url:
         try:
-            client = MongoClient(mongodb_url)
-            db = client["nba_players"]
-            players_collection = db["nba_players"]
+            players_collection = get_players_collection(mongodb_url)
 
-            mongo_players = list(players_collection.find({"player": {"$regex": f"^{initial}", "$options": "i"}}, {"_id": 0}))
-            if mongo_players:
-                print(f"Players found in MongoDB for initial '{initial}': {len(mongo_players)}")
-                return mongo_players  # Return the players from MongoDB if found
+            for initial in initials:
+                mongo_players = list(players_collection.find(player_name_prefix_query(initial), {"_id": 0, "player_lc": 0}))
+                if mongo_players:
+                    print(f"Players found in MongoDB for initial '{initial}': {len(mongo_players)}")
+                    players_by_initial[initial] = mongo_players
 
         except Exception as e:
             print(f"Error querying MongoDB: {e}")
 
-    # If MongoDB check fails or no data found, make a web request
-    try:
-        print(f"Fetching players from web for initial '{initial}'")
-        response = requests.get(url)
-        page_soup = get_soup(response)
-        table_rows = page_soup.find('tbody').find_all('tr')
-
-        for row in table_rows:
-            player_name = row.find('th', {'data-stat': 'player'}).text.encode('latin1').decode('utf-8')
-            data = {
-                'player': player_name,
-                'link': row.find('a').get('href').replace('.html', ''),
-                'year_min': get_stat_value(row, 'year_min'),
-                'year_max': get_stat_value(row, 'year_max'),
-                'pos': get_stat_value(row, 'pos'),
-                'height': get_stat_value(row, 'height'),
-                'height_inches': convert_height_to_inches(get_stat_value(row, 'height')) if get_stat_value(row, 'height') else None,
-                'weight': get_stat_value(row, 'weight'),
-                'birth_date': get_stat_value(row, 'birth_date'),
-                'colleges': get_stat_value(row, 'colleges')
-            }
-
-            college_element = get_stat_value(row, 'colleges', is_text=False)
-            if college_element:
-                try:
-                    data['college_link'] = college_element.find('a').get('href')
-                except AttributeError:
-                    print(f"College link not found for {data['player']}")
-
-            players.append(data)
-
-        return players
-
-    except Exception as e:
-        print(f"Error encountered while fetching {url}: {e}")
-        return []
+    # If MongoDB check fails or no data found, make web requests for the remaining initials at once
+    missing_initials = [initial for initial in initials if initial not in players_by_initial]
+    if missing_initials:
+        print(f"Fetching players from web for initials {', '.join(repr(initial) for initial in missing_initials)}")
+        players_by_initial.update(zip(missing_initials, asyncio.run(fetch_player_lists_async(missing_initials))))
+
+    return [player for initial in initials for player in players_by_initial[initial]]
 
 def fetch_player_gamelogs(mongodb_url: str, player_name: str, season: Optional[str] = None) -> List[dict]:
     """
@@ -203,26 +131,26 @@ def fetch_player_gamelogs(mongodb_url: str, player_name: str, season: Optional[s
         List[dict]: A list of dictionaries containing game log data.
     """
     if mongodb_url:
-        client = MongoClient(mongodb_url)
+        client = get_mongo_client(mongodb_url)
         db = client["nba_players"]
         gamelog_collection = db["player_gamelogs"]
 
-        # Try to find the player's game logs in MongoDB
-        query = {"player": {"$regex": f"^{player_name}", "$options": "i"}}
+        # Try to find the player's game logs in MongoDB, matching the name case-insensitively and with or without the
+        # Hall of Fame asterisk so the lookup can be served by the player name index
+        query = player_name_query(player_name)
         if season:
             query["season"] = season
 
-        player_logs = list(gamelog_collection.find(query, {"_id": 0}))
-
-        if player_logs:
+        logs = list(gamelog_collection.find(query, {"_id": 0}, collation=PLAYER_NAME_COLLATION, hint=PLAYER_NAME_INDEX))
+        if logs:
             print(f"Game logs found in MongoDB for player {player_name} in season {season if season else 'all seasons'}")
-            return player_logs
+            return logs
         else:
             print(f"No game logs found in MongoDB for player {player_name}. Scraping data...")
 
             # Get player details from MongoDB (to retrieve the player_link for scraping)
-            players_collection = db["nba_players"]
-            player = players_collection.find_one({"player": {"$regex": f"^{player_name}", "$options": "i"}})
+            players_collection = get_players_collection(mongodb_url)
+            player = players_collection.find_one(player_name_query(player_name), collation=PLAYER_NAME_COLLATION)
             if not player:
                 print(f"Player not found {player_name} in DB. Scraping from web...")
                 player = fetch_players_by_name([player_name])[0]
@@ -231,19 +159,20 @@ def fetch_player_gamelogs(mongodb_url: str, player_name: str, season: Optional[s
     
     # Scrape the data using get_player_gamelog if no data is found in MongoDB
     if season:
-        logs = get_player_gamelog(player_name, player['link'], season)
+        logs = list(get_player_gamelog(player_name, player['link'], season))
         # Store the scraped data into MongoDB for future use
         if mongodb_url:
-            store_documents_in_mongodb(logs, mongodb_url, "nba_players", "player_gamelogs", ["player_link", "season", "game_season", "date_game"])
+            store_documents(gamelog_collection, logs, ["player_link", "season", "game_season", "date_game"], fast_insert=True)
         return logs
     else:
-        # If no season is provided, fetch all seasons the player played
-        logs = []
-        for year in range(int(player['year_min']), int(player['year_max']) + 1):
-            logs_for_season = get_player_gamelog(player_name, player['link'], str(year))
-            if mongodb_url:
-                store_documents_in_mongodb(logs_for_season, mongodb_url, "nba_players", "player_gamelogs", ["player_link", "season", "game_season", "date_game"])
-            logs.extend(logs_for_season)
+        # If no season is provided, fetch all seasons the player played concurrently
+        seasons = [str(year) for year in range(int(player['year_min']), int(player['year_max']) + 1)]
+        season_logs = asyncio.run(get_player_gamelogs_async(player_name, player['link'], seasons))
+        logs = [log for logs_for_season in season_logs for log in logs_for_season]
+
+        # Store all seasons of the player into MongoDB at once
+        if mongodb_url:
+            store_documents(gamelog_collection, logs, ["player_link", "season", "game_season", "date_game"], fast_insert=True)
         return logs
 
 ### Main Entrypoint ###
@@ -253,7 +182,8 @@ def main(mongodb_url: str,
          add_player_gamelog_names: Optional[str] = None, 
          fetch_players: Optional[str] = None, 
          fetch_gamelogs: Optional[str] = None,
-         check_missing_averages: Optional[str] = None):
+         check_missing_averages: Optional[str] = None,
+         check_missing_data: Optional[str] = None):
     """
     Main entry point for the script. Delegates to different functions based on the input.
 
@@ -263,13 +193,24 @@ def main(mongodb_url: str,
         add_player_gamelog_names (Optional[str]): Input string to specify the players or initials to update gamelogs with player names.
         fetch_players_input (Optional[str]): Input string to specify the players or initials to fetch.
         fetch_player_gamelogs (Optional[str]): Input string to specify the player and optional season (e.g., 'Kobe Bryant:2009').
+        check_missing_data (Optional[str]): Input string to specify the players or initials to check for missing game logs and season averages in one pass.
     """
+    if mongodb_url:
+        # Lookups still work, falling back to the web, if MongoDB is unavailable or the user can only read from it
+        try:
+            ensure_indexes(mongodb_url)
+        except Exception as e:
+            print(f"Error preparing MongoDB indexes: {e}")
+
     if check_missing_players:
         handle_missing_players(mongodb_url, check_missing_players)
 
     if check_missing_averages:
         handle_missing_player_averages(mongodb_url, check_missing_averages)
 
+    if check_missing_data:
+        handle_missing_player_data(mongodb_url, check_missing_data)
+
     if add_player_gamelog_names:
         handle_gamelog_name_add(mongodb_url, add_player_gamelog_names)
 
@@ -293,6 +234,7 @@ if __name__ == '__main__':
     parser.add_argument("--mongodb-url", type=str, help="MongoDB connection string")
     parser.add_argument("--check-missing-players", type=str, help="Check and update missing game logs for a player (e.g. 'Kobe Bryant', 'a-c', 'b', 'Kobe Bryant,Paul Pierce')")
     parser.add_argument("--check-missing-averages", type=str, help="Check and update missing season averages logs for a player (e.g. 'Kobe Bryant', 'a-c', 'b', 'Kobe Bryant,Paul Pierce')")
+    parser.add_argument("--check-missing-data", type=str, help="Check and update missing game logs and season averages for a player in one pass (e.g. 'Kobe Bryant', 'a-c', 'b', 'Kobe Bryant,Paul Pierce')")
     parser.add_argument("--add-player-gamelog-names", type=str, help="Add player names to gamelogs based on initials or player names (e.g. 'Kobe Bryant', 'a-c', 'b', 'Kobe Bryant, Paul Pierce')")
     parser.add_argument("--fetch-players", type=str, help="Fetch player information based on a name, list of names, initials, or a range of initials (e.g. 'Kobe Bryant', 'a-c', 'b')")
     parser.add_argument("--fetch-gamelogs", type=str, help="Fetch player game logs for the specified player and optional season (e.g., 'Kobe Bryant:2009')")
@@ -303,4 +245,5 @@ if __name__ == '__main__':
          args.add_player_gamelog_names, 
          args.fetch_players, 
          args.fetch_gamelogs,
-         args.check_missing_averages)
+         args.check_missing_averages,
+         args.check_missing_data)
@@ -1,52 +1,268 @@
-import requests
+import os
+import re
+import json
+import time
+import asyncio
+import functools
+import threading
 
-from typing import Optional, List
-from bs4 import BeautifulSoup, Tag
+from typing import Optional, List, Dict, Tuple, Callable, Sequence, FrozenSet
+from lxml import html
+
+# Player height in feet-inches format (e.g., '6-7')
+HEIGHT_PATTERN = re.compile(r'(\d+)-(\d+)')
+
+# Comment delimiters Basketball Reference wraps its secondary stats tables in
+COMMENT_MARKERS = re.compile(rb'<!--|-->')
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many requests are sent per second. Every request reserves a token; when the
+    bucket is empty the caller waits until its token has been refilled, so concurrent callers share one rate budget.
+    The rate adapts to the server: it is halved whenever the server pushes back and grows back linearly, up to the
+    initial rate, while requests succeed.
+
+    Args:
+        rate (float): The number of tokens refilled per second, and the highest rate the limiter returns to.
+        capacity (int, optional): The maximum number of tokens the bucket holds, i.e. the largest burst. Defaults to 1.
+        min_rate (Optional[float], optional): The lowest rate backing off can reach. Defaults to a sixteenth of the rate.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1, min_rate: Optional[float] = None):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate or rate / 16
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Takes a token from the bucket, going into debt if it is empty.
+
+        Returns:
+            float: The number of seconds to wait before the reserved token is available.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def _set_rate(self, rate: float):
+        """
+        Changes the refill rate, keeping the time callers already waiting for their token have left unchanged. Must be
+        called with the lock held.
+
+        Args:
+            rate (float): The new number of tokens refilled per second.
+        """
+        self._refill()
+        if self._tokens < 0:
+            self._tokens *= rate / self.rate
+        self.rate = rate
+
+    def _refill(self):
+        """
+        Adds the tokens refilled since the last update. Must be called with the lock held.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """
+        Blocks the calling thread until a request may be sent.
+        """
+        time.sleep(self._reserve())
+
+    async def acquire_async(self):
+        """
+        Suspends the calling coroutine until a request may be sent.
+        """
+        await asyncio.sleep(self._reserve())
+
+    def increase_rate(self):
+        """
+        Raises the rate by a tenth of the maximum rate after a successful request, without exceeding the maximum.
+        """
+        with self._lock:
+            self._set_rate(min(self.max_rate, self.rate + self.max_rate / 10))
+
+    def decrease_rate(self, retry_after: Optional[float] = None):
+        """
+        Halves the rate after the server rejected a request for being too fast or overloaded.
+
+        Args:
+            retry_after (Optional[float], optional): Seconds the server asked to wait (its Retry-After header). If given,
+                no request is let through before that time. Defaults to None.
+        """
+        with self._lock:
+            self._set_rate(max(self.min_rate, self.rate / 2))
+            if retry_after:
+                self._tokens = min(self._tokens, -retry_after * self.rate)
+
+
+class JsonCache:
+    """
+    Cache of scraped data kept in memory and persisted as one JSON file per key, so later runs can reuse pages fetched
+    by earlier ones. Entries older than the maximum age are ignored.
+
+    Args:
+        directory (str): The directory the JSON files are stored in. Created on first write.
+        max_age (float): The number of seconds an entry stays valid.
+    """
+
+    def __init__(self, directory: str, max_age: float):
+        self.directory = directory
+        self.max_age = max_age
+        self._entries = {}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key.strip('/').replace('/', '_') + '.json')
+
+    def get(self, key: str):
+        """
+        Looks up a cached value, loading it from disk if it is not in memory yet.
+
+        Args:
+            key (str): The cache key, e.g. a last name initial or a player link.
+
+        Returns:
+            The cached value, or None if there is no valid entry for the key.
+        """
+        now = time.time()
+        if key in self._entries:
+            stored_at, value = self._entries[key]
+            if now - stored_at < self.max_age:
+                return value
+
+        try:
+            path = self._path(key)
+            stored_at = os.path.getmtime(path)
+            if now - stored_at >= self.max_age:
+                return None
+            with open(path, encoding='utf-8') as cache_file:
+                value = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+
+        self._entries[key] = (stored_at, value)
+        return value
+
+    def set(self, key: str, value):
+        """
+        Stores a value in memory and on disk. Failing to write the file only loses the on-disk copy.
+
+        Args:
+            key (str): The cache key, e.g. a last name initial or a player link.
+            value: The JSON serializable value to store.
+        """
+        self._entries[key] = (time.time(), value)
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path(key), 'w', encoding='utf-8') as cache_file:
+                json.dump(value, cache_file)
+        except OSError as e:
+            print(f"Error encountered while caching {key}: {e}")
 
 
 ### Utility Methods ###
 
-def get_soup(response: requests.Response) -> BeautifulSoup:
+def get_tree(content: bytes, uncomment: bool = False) -> html.HtmlElement:
     """
-    Parses an HTTP response into a BeautifulSoup object.
+    Parses a page into an lxml HTML tree. The raw bytes are handed to lxml so the page is decoded using the charset it
+    declares.
 
     Args:
-        response (requests.Response): The HTTP response object obtained from a web request.
+        content (bytes): The raw body of the HTTP response.
+        uncomment (bool, optional): Remove comment delimiters first, since Basketball Reference ships most of its stats
+            tables inside HTML comments that are filled in by JavaScript. Defaults to False.
 
     Returns:
-        BeautifulSoup: Parsed HTML content of the response.
+        html.HtmlElement: Root element of the parsed HTML content of the page.
     """
-    return BeautifulSoup(response.text, 'html.parser')
+    if uncomment:
+        content = COMMENT_MARKERS.sub(b'', content)
+    return html.fromstring(content)
 
 
-def convert_height_to_inches(height: str) -> int:
+@functools.lru_cache(maxsize=64)
+def convert_height_to_inches(height: str) -> Optional[int]:
     """
-    Converts a player's height from feet-inches format to total inches.
+    Converts a player's height from feet-inches format to total inches. Player lists only hold a few dozen distinct
+    heights, so conversions are memoized.
 
     Args:
         height (str): A string representing the height in the format 'feet-inches' (e.g., '6-7').
 
     Returns:
-        int: The height converted to inches.
+        Optional[int]: The height converted to inches, or None if the height is not in the expected format.
     """
-    feet, inches = map(int, height.split('-'))
-    return feet * 12 + inches
+    match = HEIGHT_PATTERN.match(height)
+    if match is None:
+        return None
+    return int(match[1]) * 12 + int(match[2])
 
 
-def get_stat_value(row: Tag, stat_name: str, is_text: bool = True) -> Optional[str]:
+def get_row_stats(row: html.HtmlElement) -> Dict[str, str]:
     """
-    Extracts the value of a specified stat from a row in an HTML table.
+    Collects the text value of every cell in a row of an HTML table in a single pass, including the row header.
 
     Args:
-        row (Tag): A BeautifulSoup Tag object representing a row of an HTML table.
-        stat_name (str): The data-stat attribute name to search for in the table row.
-        is_text (bool, optional): If True, returns the text value of the stat. If False, returns the Tag object. Defaults to True.
+        row (html.HtmlElement): An lxml element representing a row of an HTML table.
 
     Returns:
-        Optional[str]: The text value of the specified stat if found, or None if the stat is not present.
+        Dict[str, str]: A mapping of each cell's data-stat attribute name to its text value.
     """
-    try:
-        element = row.find('td', {'data-stat': stat_name})
-        return element.text if is_text else element
-    except AttributeError:
-        return None
+    return {cell.get('data-stat'): cell.text_content() for cell in row.iterchildren('th', 'td')}
+
+
+def compile_row_parser(fields: Sequence[Tuple[str, ...]], constants: Optional[Dict[str, str]] = None) -> Callable[[Dict[str, str], dict], dict]:
+    """
+    Generates a function that builds a document from the stats of a table row. The generated function is a single
+    dict display with one lookup per field, so the field table is only interpreted once, when the parser is compiled,
+    instead of for every row.
+
+    Args:
+        fields (Sequence[Tuple[str, ...]]): The (document key, data-stat, ...) tuples to extract from the row. When a
+            field lists several data-stat names, the first non-empty one is used.
+        constants (Optional[Dict[str, str]], optional): Extra keys set to the same value for every row. Defaults to None.
+
+    Returns:
+        Callable[[Dict[str, str], dict], dict]: A function taking the row stats (as returned by get_row_stats) and a
+        dictionary of context keys copied into every document, and returning the document.
+    """
+    lines = ["def parse_row(stats, context):", "    get = stats.get", "    return {", "        **context,"]
+    lines += [f"        {key!r}: {' or '.join(f'get({stat!r})' for stat in stats)}," for key, *stats in fields]
+    lines += [f"        {key!r}: {value!r}," for key, value in (constants or {}).items()]
+    lines.append("    }")
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["parse_row"]
+
+
+@functools.lru_cache(maxsize=None)
+def compile_table_parser(fields: Tuple[Tuple[str, ...], ...], data_stats: FrozenSet[str]) -> Callable[[Dict[str, str], dict], dict]:
+    """
+    Generates a row parser for a table whose cells carry the given data-stat names. The data-stat names of each field
+    are narrowed once for the whole table to the ones it has, so a field with fallbacks costs a single lookup for rows
+    where the first one is filled in. The last name is kept so empty cells still resolve as they would for the full
+    field. Parsers are cached, tables with the same columns share one.
+
+    Args:
+        fields (Tuple[Tuple[str, ...], ...]): The (document key, data-stat, ...) tuples to extract from the rows.
+        data_stats (FrozenSet[str]): The data-stat names of the table's cells.
+
+    Returns:
+        Callable[[Dict[str, str], dict], dict]: A row parser, see compile_row_parser.
+    """
+    table_fields = []
+    for key, *stats in fields:
+        table_stats = [stat for stat in stats[:-1] if stat in data_stats]
+        table_fields.append((key, *table_stats, stats[-1]))
+
+    return compile_row_parser(table_fields)
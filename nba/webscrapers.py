@@ -1,123 +1,658 @@
-import requests
+import os
 import time
+import atexit
+import contextlib
+import multiprocessing
+import random
+import aiohttp
+import asyncio
+import requests
+import pandas as pd
 
-from utilities import get_stat_value, get_soup, convert_height_to_inches
+from typing import Awaitable, Callable, List, Optional, Tuple, TypeVar
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from utilities import RateLimiter, JsonCache, compile_row_parser, compile_table_parser, get_row_stats, get_tree, convert_height_to_inches
 
-def get_player_averages(player_name: str, player_link: str):
-    url = f'https://www.basketball-reference.com{player_link}.html'
+# Seconds to wait for a connection to Basketball Reference to be established
+CONNECT_TIMEOUT = 5
+
+# Seconds to wait for Basketball Reference to answer a request
+REQUEST_TIMEOUT = 30
+
+# Maximum number of requests in flight to Basketball Reference from the asynchronous scrapers
+MAX_CONCURRENT_REQUESTS = 8
+
+# Bytes of a response body handed to the parser at once when streaming a page
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Statuses telling that Basketball Reference is throttling or overloaded, the request is retried and the rate lowered
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Maximum number of times a throttled or failed request is retried
+MAX_RETRIES = 5
+
+# Seconds waited before the first retry, doubled for every following one, plus up to as much random jitter
+BACKOFF_INITIAL = 1
+
+# Longest wait in seconds between two attempts of a request
+BACKOFF_MAX = 60
+
+# Result type of the functions reading a response body
+T = TypeVar('T')
+
+# Number of worker processes parsing the pages downloaded by the asynchronous scrapers
+PARSE_WORKERS = os.cpu_count() or 1
+
+# Basketball Reference allows up to 20 requests per minute, shared by every scraper and thread
+RATE_LIMITER = RateLimiter(rate=20 / 60)
+
+USER_AGENT = 'Mozilla/5.0 (compatible; pro-sports-reference-webscraper)'
+
+# HTTP session shared by all scrapers so connections to Basketball Reference are pooled and kept alive
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = USER_AGENT
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+atexit.register(SESSION.close)
+
+def get_retry_after(headers) -> Optional[float]:
+    """
+    Reads the number of seconds a server asked clients to wait from its Retry-After header.
+
+    Args:
+        headers (Mapping[str, str]): The headers of the HTTP response.
+
+    Returns:
+        Optional[float]: The seconds to wait, or None if the header is missing or holds a date.
+    """
+    retry_after = headers.get('Retry-After')
+    return float(retry_after) if retry_after and retry_after.isdigit() else None
+
+def get_backoff(attempt: int) -> float:
+    """
+    Computes how long to wait before retrying a request, growing exponentially with the attempts made so far. Random
+    jitter is added so concurrent requests failing together do not all retry at the same moment.
+
+    Args:
+        attempt (int): The number of attempts already made, starting at 0 for the first one.
+
+    Returns:
+        float: The seconds to wait, at most BACKOFF_MAX.
+    """
+    return min(BACKOFF_MAX, BACKOFF_INITIAL * 2 ** attempt + random.uniform(0, BACKOFF_INITIAL))
+
+def request_page(url: str, read_body: Callable[[requests.Response], T]) -> T:
+    """
+    Requests a page from Basketball Reference through the shared session, waiting for the rate limiter first, and
+    reads its body. Mirrors request_page_async: every attempt takes a token from the rate limiter, throttled requests
+    slow the rate limiter down, honoring the server's Retry-After, and throttled requests and network errors,
+    including errors while the body is read, are retried up to MAX_RETRIES times with exponential backoff and jitter.
+
+    Args:
+        url (str): The URL of the page.
+        read_body (Callable[[requests.Response], T]): Reads the body of a successful, streamed response. Called again
+            from scratch for every attempt.
+
+    Returns:
+        T: What read_body returned.
+
+    Raises:
+        requests.HTTPError: If the server answered with an error status.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        RATE_LIMITER.acquire()
+        try:
+            with SESSION.get(url, timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT), stream=True) as response:
+                if response.status_code in RETRY_STATUSES:
+                    RATE_LIMITER.decrease_rate(get_retry_after(response.headers))
+                response.raise_for_status()
+                body = read_body(response)
+        except requests.RequestException as e:
+            # Only throttled statuses are worth retrying, other error statuses will not change
+            retryable = not isinstance(e, requests.HTTPError) or e.response.status_code in RETRY_STATUSES
+            if attempt == MAX_RETRIES or not retryable:
+                raise
+            time.sleep(get_backoff(attempt))
+            continue
+
+        RATE_LIMITER.increase_rate()
+        return body
+
+def fetch_page(url: str) -> bytes:
+    """
+    Fetches a page from Basketball Reference. See request_page.
+
+    Args:
+        url (str): The URL of the page.
+
+    Returns:
+        bytes: The raw body of the page.
+    """
+    return request_page(url, lambda response: response.content)
+
+def fetch_tree(url: str) -> html.HtmlElement:
+    """
+    Fetches a page from Basketball Reference and parses it with lxml. Like fetch_tree_async, the body is fed to the
+    parser chunk by chunk as it is downloaded and decompressed, so it is never joined into a single bytes object.
+    See request_page.
+
+    Args:
+        url (str): The URL of the page.
+
+    Returns:
+        html.HtmlElement: Root element of the parsed page.
+    """
+    def parse_body(response: requests.Response) -> html.HtmlElement:
+        parser = html.HTMLParser()
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+        return parser.close()
+
+    return request_page(url, parse_body)
+
+def create_client_session() -> aiohttp.ClientSession:
+    """
+    Creates the aiohttp session used by the asynchronous scrapers. Connections are pooled and kept alive, with at most
+    MAX_CONCURRENT_REQUESTS of them open to Basketball Reference.
+
+    Returns:
+        aiohttp.ClientSession: The HTTP session, to be used as an async context manager.
+    """
+    connector = aiohttp.TCPConnector(limit=16, limit_per_host=MAX_CONCURRENT_REQUESTS, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT, sock_connect=CONNECT_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT}, timeout=timeout)
+
+def use_client_session(session: Optional[aiohttp.ClientSession] = None):
+    """
+    Returns an async context manager yielding the given aiohttp session, or a new one from create_client_session if
+    none is given. A session passed in is left open, so callers can share one session across several scrapers.
+
+    Args:
+        session (Optional[aiohttp.ClientSession], optional): The HTTP session to use. Defaults to None.
+
+    Returns:
+        An async context manager yielding the HTTP session.
+    """
+    return contextlib.nullcontext(session) if session is not None else create_client_session()
+
+async def request_page_async(session: aiohttp.ClientSession, url: str,
+                             read_body: Callable[[aiohttp.ClientResponse], Awaitable[T]]) -> T:
+    """
+    Requests a page from Basketball Reference without blocking the event loop, waiting for the rate limiter first, and
+    reads its body. Throttled requests slow the rate limiter down, honoring the server's Retry-After. Throttled
+    requests and network errors, including errors while the body is read, are retried up to MAX_RETRIES times with
+    exponential backoff and jitter between attempts.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session used to fetch the page.
+        url (str): The URL of the page.
+        read_body (Callable[[aiohttp.ClientResponse], Awaitable[T]]): Reads the body of a successful response. Called
+            again from scratch for every attempt.
+
+    Returns:
+        T: What read_body returned.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await RATE_LIMITER.acquire_async()
+        try:
+            async with session.get(url) as response:
+                if response.status in RETRY_STATUSES:
+                    RATE_LIMITER.decrease_rate(get_retry_after(response.headers))
+                response.raise_for_status()
+                body = await read_body(response)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Only throttled statuses are worth retrying, other error statuses will not change
+            retryable = not isinstance(e, aiohttp.ClientResponseError) or e.status in RETRY_STATUSES
+            if attempt == MAX_RETRIES or not retryable:
+                raise
+            await asyncio.sleep(get_backoff(attempt))
+            continue
+
+        RATE_LIMITER.increase_rate()
+        return body
+
+async def fetch_page_async(session: aiohttp.ClientSession, url: str) -> bytes:
+    """
+    Fetches a page from Basketball Reference without blocking the event loop. See request_page_async.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session used to fetch the page.
+        url (str): The URL of the page.
+
+    Returns:
+        bytes: The raw body of the page.
+    """
+    return await request_page_async(session, url, lambda response: response.read())
+
+async def fetch_tree_async(session: aiohttp.ClientSession, url: str) -> html.HtmlElement:
+    """
+    Fetches a page from Basketball Reference without blocking the event loop and parses it with lxml. The body is fed
+    to the parser chunk by chunk as it is downloaded and decompressed, so the page is parsed while it arrives and the
+    whole body is never held in memory. See request_page_async.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session used to fetch the page.
+        url (str): The URL of the page.
+
+    Returns:
+        html.HtmlElement: Root element of the parsed page.
+    """
+    async def parse_body(response: aiohttp.ClientResponse) -> html.HtmlElement:
+        parser = html.HTMLParser()
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+        return parser.close()
+
+    return await request_page_async(session, url, parse_body)
+
+async def gather_bounded(coroutines) -> list:
+    """
+    Runs coroutines concurrently, keeping at most MAX_CONCURRENT_REQUESTS of them running at once.
+
+    Args:
+        coroutines (Iterable[Coroutine]): The coroutines to run.
+
+    Returns:
+        list: The result of each coroutine, in the order they were given.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def run(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*[run(coroutine) for coroutine in coroutines])
+
+# Process pool parsing the pages of the asynchronous scrapers, created on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Returns the process pool the asynchronous scrapers parse pages in, creating it on first use. Parsing is CPU bound
+    and holds the GIL, so running it in worker processes keeps the event loop free to download the next pages.
+
+    Returns:
+        ProcessPoolExecutor: The pool of PARSE_WORKERS processes, shut down when the interpreter exits.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        # Workers are started from a clean server process, forking this one could copy locks held by the threads of
+        # the MongoDB and HTTP clients and deadlock
+        _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context('forkserver'))
+        atexit.register(_parse_pool.shutdown)
+    return _parse_pool
+
+async def run_in_parse_pool(function, *args):
+    """
+    Runs a parsing function in the parse pool without blocking the event loop. See get_parse_pool.
+
+    Args:
+        function (Callable): A module level function, so it can be sent to the worker processes.
+        *args: The arguments of the function, e.g. the raw body of a page.
+
+    Returns:
+        The result of the function.
+    """
+    return await asyncio.get_running_loop().run_in_executor(get_parse_pool(), function, *args)
+
+# Seconds scraped player lists and averages are reused for, across runs, before being fetched again
+CACHE_MAX_AGE = 24 * 60 * 60
+
+# Caches of the scraped player lists, keyed by last name initial, and season averages, keyed by player link
+PLAYER_LIST_CACHE = JsonCache(os.path.join('.cache', 'player_lists'), CACHE_MAX_AGE)
+PLAYER_AVERAGES_CACHE = JsonCache(os.path.join('.cache', 'player_averages'), CACHE_MAX_AGE)
+
+# Precompiled XPath expressions shared by the table scrapers
+TABLE_ROWS = etree.XPath('(//tbody)[1]/tr')
+PLAYER_LINK = etree.XPath("string((.//a)[1]/@href)", smart_strings=False)
+TABLE_BODIES = etree.XPath('//tbody')
+BODY_ROWS = etree.XPath('tr')
+ROW_HEADER = etree.XPath('string(th)', smart_strings=False)
+COLLEGE_LINKS = etree.XPath("td[@data-stat='colleges']//a/@href", smart_strings=False)
+
+# Game log fields recorded for every game, as (document key, data-stat) pairs
+GAMELOG_GAME_FIELDS = (
+    ('game_season', 'game_season'),
+    ('date_game', 'date_game'),
+    ('age', 'age'),
+    ('team_id', 'team_id'),
+    ('game_location', 'game_location'),
+    ('opp_id', 'opp_id'),
+    ('game_result', 'game_result'),
+)
+
+# Game log fields only recorded for games the player was active in
+GAMELOG_STAT_FIELDS = (
+    ('games_started', 'gs'),
+    ('minutes_played', 'mp'),
+    ('field_goals', 'fg'),
+    ('field_goals_attempted', 'fga'),
+    ('field_goal_percentage', 'fg_pct'),
+    ('3point_field_goals', 'fg3'),
+    ('3point_field_goals_attempted', 'fg3a'),
+    ('3point_field_goal_percentage', 'fg3_pct'),
+    ('free_throws', 'ft'),
+    ('free_throws_attempted', 'fta'),
+    ('free_throw_percentage', 'ft_pct'),
+    ('offensive_rebounds', 'orb'),
+    ('defensive_rebounds', 'drb'),
+    ('total_rebounds', 'trb'),
+    ('assists', 'ast'),
+    ('steals', 'stl'),
+    ('blocks', 'blk'),
+    ('turnovers', 'tov'),
+    ('personal_fouls', 'pf'),
+    ('points', 'pts'),
+    ('game_score', 'game_score'),
+    ('plus_minus', 'plus_minus'),
+)
+
+# Row parsers generated once from the field tables above
+parse_active_gamelog_row = compile_row_parser(GAMELOG_GAME_FIELDS + GAMELOG_STAT_FIELDS)
+parse_inactive_gamelog_row = compile_row_parser(GAMELOG_GAME_FIELDS, {'status': "Inactive"})
+
+# Columns of a game log DataFrame, in the order the row parsers build them
+GAMELOG_COLUMNS = ['player', 'player_link', 'season'] + [key for key, _ in GAMELOG_GAME_FIELDS + GAMELOG_STAT_FIELDS] + ['status']
+
+# Season averages fields of the per game and totals tables, as (document key, data-stat, ...) tuples. The per game
+# table names its stats with a '_per_g' suffix, the totals table without it
+AVERAGES_FIELDS = (
+    ('age', 'age'),
+    ('team_id', 'team_id'),
+    ('lg_id', 'lg_id'),
+    ('games', 'g'),
+    ('games_started', 'gs'),
+    ('minutes_per_game', 'mp_per_g', 'mp'),
+    ('field_goals', 'fg_per_g', 'fg'),
+    ('field_goal_attempts', 'fga_per_g', 'fga'),
+    ('field_goal_percentage', 'fg_pct'),
+    ('3_point_field_goals', 'fg3_per_g', 'fg3'),
+    ('3_Point_field_goal_attempts', 'fg3a_per_g', 'fg3a'),
+    ('3_point_field_goal_percentage', 'fg3_pct'),
+    ('2_point_field_goals', 'fg2_per_g', 'fg2'),
+    ('2_point_field_goal_attempts', 'fg2a_per_g', 'fg2a'),
+    ('2_point_field_goal_percentage', 'fg2_pct'),
+    ('effective_field_goal_percentage', 'efg_pct'),
+    ('free_throws', 'ft_per_g', 'ft'),
+    ('free_throw_attempts', 'fta_per_g', 'fta'),
+    ('free_throw_percentage', 'ft_pct'),
+    ('offensive_rebounds', 'orb_per_g', 'orb'),
+    ('defensive_rebounds', 'drb_per_g', 'drb'),
+    ('total_rebounds', 'trb_per_g', 'trb'),
+    ('assists', 'ast_per_g', 'ast'),
+    ('steals', 'stl_per_g', 'stl'),
+    ('blocks', 'blk_per_g', 'blk'),
+    ('turnovers', 'tov_per_g', 'tov'),
+    ('personal_fouls', 'pf_per_g', 'pf'),
+    ('points', 'pts_per_g', 'pts'),
+    ('awards', 'awards_summary', 'award_summary', 'awards'),
+    ('triple_doubles', 'trp_dbl'),
+)
+
+# Season averages fields of the advanced table, as (document key, data-stat, ...) tuples
+ADVANCED_FIELDS = (
+    ('age', 'age'),
+    ('team_id', 'team_id'),
+    ('lg_id', 'lg_id'),
+    ('games', 'g'),
+    ('minutes_per_game', 'mp_per_g', 'mp'),
+    ('per', 'per'),
+    ('true_shooting_percentage', 'ts_pct'),
+    ('fg3a_per_fga_pct', 'fg3a_per_fga_pct'),
+    ('fta_per_fga_pct', 'fta_per_fga_pct'),
+    ('orb_pct', 'orb_pct'),
+    ('drb_pct', 'drb_pct'),
+    ('trb_pct', 'trb_pct'),
+    ('ast_pct', 'ast_pct'),
+    ('stl_pct', 'stl_pct'),
+    ('blk_pct', 'blk_pct'),
+    ('tov_pct', 'tov_pct'),
+    ('usg_pct', 'usg_pct'),
+    ('ows', 'ows'),
+    ('dws', 'dws'),
+    ('ws', 'ws'),
+    ('ws_per_48', 'ws_per_48'),
+    ('obpm', 'obpm'),
+    ('dbpm', 'dbpm'),
+    ('bpm', 'bpm'),
+    ('vorp', 'vorp'),
+)
+
+# Season averages table types, as (name found in the table row ids, fields) pairs
+AVERAGES_TABLE_TYPES = (
+    ('per_game', AVERAGES_FIELDS),
+    ('totals', AVERAGES_FIELDS),
+    ('advanced', ADVANCED_FIELDS),
+)
+
+# Reasons shown in place of the stats of a game the player did not play in
+INACTIVE_STATUSES = frozenset({'Injured Reserve', 'Not With Team', 'Did Not Dress', 'Inactive', 'Did Not Play'})
+
+# Player list fields, as (document key, data-stat) pairs
+PLAYER_LIST_FIELDS = (
+    ('year_min', 'year_min'),
+    ('year_max', 'year_max'),
+    ('pos', 'pos'),
+    ('height', 'height'),
+    ('weight', 'weight'),
+    ('birth_date', 'birth_date'),
+    ('colleges', 'colleges'),
+)
+
+# Player list row parser generated once from the field table above
+parse_player_list_row = compile_row_parser(PLAYER_LIST_FIELDS)
+
+def parse_player_averages(tree: html.HtmlElement, player_name: str, player_link: str) -> List[dict]:
+    """
+    Extracts the per game, totals and advanced season averages from a parsed Basketball Reference player page.
+
+    Args:
+        tree (html.HtmlElement): The parsed player page, with its commented out tables included (see get_tree).
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+
+    Returns:
+        log (list): A list of dictionaries containing the averages of a season, one per table row.
+
+    Raises:
+        ValueError: If the page has no table, e.g. a block or error page served with a success status.
+    """
     log = []
 
+    tables = TABLE_BODIES(tree)
+    if not tables:
+        raise ValueError("no stats table found on the page")
+
+    for table in tables:
+        table_rows = BODY_ROWS(table)
+
+        # The table is identified by the id of its rows, e.g. 'per_game.2004' or 'playoffs_totals.2004'
+        type_id = table_rows[0].get('id') if table_rows else None
+        if not type_id:
+            continue
+
+        table_type, fields = next(((name, fields) for name, fields in AVERAGES_TABLE_TYPES if name in type_id), (None, None))
+        if table_type is None:
+            continue
+
+        table_rows = [(ROW_HEADER(table_row), get_row_stats(table_row)) for table_row in table_rows]
+
+        # Pick the row parser matching the columns this table has, so each field is a single lookup per row
+        parse_row = compile_table_parser(fields, frozenset(stat for _, stats in table_rows for stat in stats))
+
+        context = {'player': player_name, 'player_link': player_link, 'type': table_type, 'playoffs': "playoff" in type_id}
+        for season, stats in table_rows:
+            context['season'] = season
+            log.append(parse_row(stats, context))
+
+    return log
+
+def parse_player_averages_page(content: bytes, player_name: str, player_link: str) -> List[dict]:
+    """
+    Parses a Basketball Reference player page and extracts its season averages. See parse_player_averages.
+
+    Args:
+        content (bytes): The raw body of the player page.
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+
+    Returns:
+        log (list): A list of dictionaries containing the averages of a season, one per table row.
+    """
+    return parse_player_averages(get_tree(content, uncomment=True), player_name, player_link)
+
+def get_player_averages(player_name: str, player_link: str) -> List[dict]:
+    """
+    Fetches the season averages of a player from Basketball Reference. Results are cached for CACHE_MAX_AGE seconds.
+
+    Args:
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+
+    Returns:
+        log (list): A list of dictionaries containing the averages of a season, one per table row.
+    """
+    url = f'https://www.basketball-reference.com{player_link}.html'
+    log = PLAYER_AVERAGES_CACHE.get(player_link)
+    if log is not None:
+        return log
+
     try:
-        response = requests.get(url)
-        page_soup = get_soup(response)
-
-        # Find game log table rows
-        tables = page_soup.find_all('tbody')
-        for i in range(len(tables)):
-            type_id = tables[i].find('tr').get('id')
-            if type_id and "playoff" in type_id:
-                playoffs = True
-            elif type_id:
-                playoffs = False
-            else:
-                continue
-
-            if type_id and "per_game" in type_id:
-                type = "per_game"
-            elif type_id and "totals" in type_id:
-                type = "totals"
-            elif type and "advanced" in type_id:
-                type = "advanced"
-
-            if type == "per_game" or type == "totals":
-                for table_row in tables[i].find_all('tr'):
-                    data = {}
-                    data['player'] = player_name
-                    data['player_link'] = player_link
-                    data['type'] = type
-                    data['playoffs'] = playoffs
-                    data['season'] = table_row.get('th', {'data-stat': 'season'}).get('text') or table_row.find('th').text
-                    data['age'] = get_stat_value(table_row, 'age')
-                    data['team_id'] = get_stat_value(table_row, 'team_id')
-                    data['lg_id'] = get_stat_value(table_row, 'lg_id')
-                    data['games'] = get_stat_value(table_row, 'g')
-                    data['games_started'] = get_stat_value(table_row, 'gs')
-                    data['minutes_per_game'] = get_stat_value(table_row, 'mp_per_g') or get_stat_value(table_row, 'mp')
-                    data['field_goals'] = get_stat_value(table_row, 'fg_per_g') or get_stat_value(table_row, 'fg')
-                    data['field_goal_attempts'] = get_stat_value(table_row, 'fga_per_g') or get_stat_value(table_row, 'fga')
-                    data['field_goal_percentage'] = get_stat_value(table_row, 'fg_pct')
-                    data['3_point_field_goals'] = get_stat_value(table_row, 'fg3_per_g') or get_stat_value(table_row, 'fg3')
-                    data['3_Point_field_goal_attempts'] = get_stat_value(table_row, 'fg3a_per_g') or get_stat_value(table_row, 'fg3a')
-                    data['3_point_field_goal_percentage'] = get_stat_value(table_row, 'fg3_pct')
-                    data['2_point_field_goals'] = get_stat_value(table_row, 'fg2_per_g') or get_stat_value(table_row, 'fg2')
-                    data['2_point_field_goal_attempts'] = get_stat_value(table_row, 'fg2a_per_g') or get_stat_value(table_row, 'fg2a')
-                    data['2_point_field_goal_percentage'] = get_stat_value(table_row, 'fg2_pct')
-                    data['effective_field_goal_percentage'] = get_stat_value(table_row, 'efg_pct')
-                    data['free_throws'] = get_stat_value(table_row, 'ft_per_g') or get_stat_value(table_row, 'ft')
-                    data['free_throw_attempts'] = get_stat_value(table_row, 'fta_per_g') or get_stat_value(table_row, 'fta')
-                    data['free_throw_percentage'] = get_stat_value(table_row, 'ft_pct')
-                    data['offensive_rebounds'] = get_stat_value(table_row, 'orb_per_g') or get_stat_value(table_row, 'orb')
-                    data['defensive_rebounds'] = get_stat_value(table_row, 'drb_per_g') or get_stat_value(table_row, 'drb')
-                    data['total_rebounds'] = get_stat_value(table_row, 'trb_per_g') or get_stat_value(table_row, 'trb')
-                    data['assists'] = get_stat_value(table_row, 'ast_per_g') or get_stat_value(table_row, 'ast')
-                    data['steals'] = get_stat_value(table_row, 'stl_per_g') or get_stat_value(table_row, 'stl')
-                    data['blocks'] = get_stat_value(table_row, 'blk_per_g') or get_stat_value(table_row, 'blk')
-                    data['turnovers'] = get_stat_value(table_row, 'tov_per_g') or get_stat_value(table_row, 'tov')
-                    data['personal_fouls'] = get_stat_value(table_row, 'pf_per_g') or get_stat_value(table_row, 'pf')
-                    data['points'] = get_stat_value(table_row, 'pts_per_g') or get_stat_value(table_row, 'pts')
-                    data['awards'] = get_stat_value(table_row, 'awards_summary') or get_stat_value(table_row, 'award_summary') or get_stat_value(table_row, 'awards')
-                    data['triple_doubles'] = get_stat_value(table_row, 'trp_dbl')
-
-                    log.append(data)
-            elif type == "advanced":
-                for table_row in tables[i].find_all('tr'):
-                    data = {}
-                    data['player'] = player_name
-                    data['player_link'] = player_link
-                    data['type'] = type
-                    data['playoffs'] = playoffs
-                    data['season'] = table_row.get('th', {'data-stat': 'season'}).get('text') or table_row.find('th').text
-                    data['age'] = get_stat_value(table_row, 'age')
-                    data['team_id'] = get_stat_value(table_row, 'team_id')
-                    data['lg_id'] = get_stat_value(table_row, 'lg_id')
-                    data['games'] = get_stat_value(table_row, 'g')
-                    data['minutes_per_game'] = get_stat_value(table_row, 'mp_per_g') or get_stat_value(table_row, 'mp')
-                    data['per'] = get_stat_value(table_row, 'per')
-                    data['true_shooting_percentage'] = get_stat_value(table_row, 'ts_pct')
-                    data['fg3a_per_fga_pct'] = get_stat_value(table_row, 'fg3a_per_fga_pct')
-                    data['fta_per_fga_pct'] = get_stat_value(table_row, 'fta_per_fga_pct')
-                    data['orb_pct'] = get_stat_value(table_row, 'orb_pct')
-                    data['drb_pct'] = get_stat_value(table_row, 'drb_pct')
-                    data['trb_pct'] = get_stat_value(table_row, 'trb_pct')
-                    data['ast_pct'] = get_stat_value(table_row, 'ast_pct')
-                    data['stl_pct'] = get_stat_value(table_row, 'stl_pct')
-                    data['blk_pct'] = get_stat_value(table_row, 'blk_pct')
-                    data['tov_pct'] = get_stat_value(table_row, 'tov_pct')
-                    data['usg_pct'] = get_stat_value(table_row, 'usg_pct')
-                    data['ows'] = get_stat_value(table_row, 'ows')
-                    data['dws'] = get_stat_value(table_row, 'dws')
-                    data['ws'] = get_stat_value(table_row, 'ws')
-                    data['ws_per_48'] = get_stat_value(table_row, 'ws_per_48')
-                    data['obpm'] = get_stat_value(table_row, 'obpm')
-                    data['dbpm'] = get_stat_value(table_row, 'dbpm')
-                    data['bpm'] = get_stat_value(table_row, 'bpm')
-                    data['vorp'] = get_stat_value(table_row, 'vorp')
-
-                    log.append(data)
+        content = fetch_page(url)
+        log = parse_player_averages_page(content, player_name, player_link)
+        PLAYER_AVERAGES_CACHE.set(player_link, log)
+    except Exception as e:
+        print(f"Error encountered while fetching {url}: {e}")
+        log = []
+
+    return log
+
+async def get_player_averages_async(session: aiohttp.ClientSession, player_name: str, player_link: str) -> List[dict]:
+    """
+    Fetches the season averages of a player from Basketball Reference without blocking the event loop. The page is
+    parsed in the parse pool. Results are cached for CACHE_MAX_AGE seconds.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session used to fetch the page.
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+
+    Returns:
+        log (list): A list of dictionaries containing the averages of a season, one per table row.
+    """
+    url = f'https://www.basketball-reference.com{player_link}.html'
+    log = PLAYER_AVERAGES_CACHE.get(player_link)
+    if log is not None:
+        return log
+
+    try:
+        content = await fetch_page_async(session, url)
+        log = await run_in_parse_pool(parse_player_averages_page, content, player_name, player_link)
+        PLAYER_AVERAGES_CACHE.set(player_link, log)
     except Exception as e:
-        # Print error and retry after 10 seconds
         print(f"Error encountered while fetching {url}: {e}")
+        log = []
 
     return log
 
+def parse_player_gamelog(tree: html.HtmlElement, player_name: str, player_link: str, season: str):
+    """
+    Extracts the game logs from a parsed Basketball Reference game log page.
+
+    Args:
+        tree (html.HtmlElement): The parsed game log page.
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+        season (str): The season of the game log page.
+
+    Yields:
+        data (dict): A dictionary containing the game log data of a single game.
+    """
+    context = {'player': player_name, 'player_link': player_link, 'season': season}
+
+    for row in TABLE_ROWS(tree):
+        cells = row.findall('td')
+
+        # Skip the repeated header rows, they have no stat cells
+        if not cells:
+            continue
+
+        stats = {td.get('data-stat'): td.text_content() for td in cells}
+
+        # Inactive or DNP games only carry the reason, in a cell spanning the stat columns
+        if stats.get('reason') not in INACTIVE_STATUSES:
+            yield parse_active_gamelog_row(stats, context)
+        else:
+            yield parse_inactive_gamelog_row(stats, context)
+
+def parse_player_gamelog_page(content: bytes, player_name: str, player_link: str, season: str) -> List[dict]:
+    """
+    Parses a Basketball Reference game log page and extracts its game logs. See parse_player_gamelog.
+
+    Args:
+        content (bytes): The raw body of the game log page.
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+        season (str): The season of the game log page.
+
+    Returns:
+        log (list): A list of dictionaries containing game log data.
+    """
+    return list(parse_player_gamelog(get_tree(content), player_name, player_link, season))
+
 def get_player_gamelog(player_name: str, player_link: str, season: str):
     """
     Fetches player game logs from Basketball Reference for a given season. Retries on failure.
+    Game logs are yielded one at a time so callers can stream them without holding a whole season in memory.
     
     Args:
         player_link (str): The player's link on Basketball Reference.
         season (str): The season to fetch game logs for.
 
+    Yields:
+        data (dict): A dictionary containing the game log data of a single game.
+    """
+    url = f'https://www.basketball-reference.com{player_link}/gamelog/{season}'
+
+    try:
+        # Fetch the page and parse with lxml
+        tree = fetch_tree(url)
+
+        yield from parse_player_gamelog(tree, player_name, player_link, season)
+
+        print(f"Processing player link: {player_link}, season: {season}")
+
+    except Exception as e:
+        # Failed requests were already retried by the session, report the error and move on
+        print(f"Error encountered while fetching {url}: {e}")
+
+def get_player_gamelog_frame(player_name: str, player_link: str, season: str) -> pd.DataFrame:
+    """
+    Fetches player game logs from Basketball Reference for a given season as a DataFrame. The rows are built straight
+    from the get_player_gamelog generator, without collecting the season into a list of dictionaries first.
+
+    Args:
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+        season (str): The season to fetch game logs for.
+
+    Returns:
+        pd.DataFrame: One row per game with the GAMELOG_COLUMNS columns. Stats of inactive games are missing.
+    """
+    return pd.DataFrame.from_records(get_player_gamelog(player_name, player_link, season), columns=GAMELOG_COLUMNS)
+
+async def get_player_gamelog_async(session: aiohttp.ClientSession, player_name: str, player_link: str, season: str) -> List[dict]:
+    """
+    Fetches player game logs from Basketball Reference for a given season without blocking the event loop. The page is
+    parsed in the parse pool.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session used to fetch the page.
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+        season (str): The season to fetch game logs for.
+
     Returns:
         log (list): A list of dictionaries containing game log data.
     """
@@ -125,79 +660,97 @@ def get_player_gamelog(player_name: str, player_link: str, season: str):
     log = []
 
     try:
-        # Fetch the page and parse with BeautifulSoup
-        response = requests.get(url)
-        page_soup = get_soup(response)
-
-        # Find game log table rows
-        table_rows = page_soup.find('tbody').find_all('tr')
-
-        # Handle inactive or DNP games
-        inactive_game = []
-        to_ignore = []
-        for i in range(len(table_rows)):
-            elements = table_rows[i].find_all('td')
-            try:
-                x = elements[len(elements) - 1].text
-                if x == 'Injured Reserve' or x == 'Not With Team' or x == 'Did Not Dress' or x == 'Inactive' or x == 'Did Not Play':
-                    inactive_game.append(i)
-            except:
-                to_ignore.append(i)
-
-        for i in range(len(table_rows)):
-            if i not in to_ignore:
-                data = {}
-                data['player'] = player_name
-                data['player_link'] = player_link
-                data['season'] = season
-                data['game_season'] = get_stat_value(table_rows[i], 'game_season')
-                data['date_game'] = get_stat_value(table_rows[i], 'date_game')
-                data['age'] = get_stat_value(table_rows[i], 'age')
-                data['team_id'] = get_stat_value(table_rows[i], 'team_id')
-                data['game_location'] = get_stat_value(table_rows[i], 'game_location')
-                data['opp_id'] = get_stat_value(table_rows[i], 'opp_id')
-                data['game_result'] = get_stat_value(table_rows[i], 'game_result')
-                if i not in inactive_game:
-                    data['games_started'] = get_stat_value(table_rows[i], 'gs')
-                    data['minutes_played'] = get_stat_value(table_rows[i], 'mp')
-                    data['field_goals'] = get_stat_value(table_rows[i], 'fg')
-                    data['field_goals_attempted'] = get_stat_value(table_rows[i], 'fga')
-                    data['field_goal_percentage'] = get_stat_value(table_rows[i], 'fg_pct')
-                    data['3point_field_goals'] = get_stat_value(table_rows[i], 'fg3')
-                    data['3point_field_goals_attempted'] = get_stat_value(table_rows[i], 'fg3a')
-                    data['3point_field_goal_percentage'] = get_stat_value(table_rows[i], 'fg3_pct')
-                    data['free_throws'] = get_stat_value(table_rows[i], 'ft')
-                    data['free_throws_attempted'] = get_stat_value(table_rows[i], 'fta')
-                    data['free_throw_percentage'] = get_stat_value(table_rows[i], 'ft_pct')
-                    data['offensive_rebounds'] = get_stat_value(table_rows[i], 'orb')
-                    data['defensive_rebounds'] = get_stat_value(table_rows[i], 'drb')
-                    data['total_rebounds'] = get_stat_value(table_rows[i], 'trb')
-                    data['assists'] = get_stat_value(table_rows[i], 'ast')
-                    data['steals'] = get_stat_value(table_rows[i], 'stl')
-                    data['blocks'] = get_stat_value(table_rows[i], 'blk')
-                    data['turnovers'] = get_stat_value(table_rows[i], 'tov')
-                    data['personal_fouls'] = get_stat_value(table_rows[i], 'pf')
-                    data['points'] = get_stat_value(table_rows[i], 'pts')
-                    data['game_score'] = get_stat_value(table_rows[i], 'game_score')
-                    data['plus_minus'] = get_stat_value(table_rows[i], 'plus_minus')
-                else:
-                    data['status'] = "Inactive"
-
-                log.append(data)
-
+        # Fetch the page and parse it with lxml in a worker process
+        content = await fetch_page_async(session, url)
+        log = await run_in_parse_pool(parse_player_gamelog_page, content, player_name, player_link, season)
         print(f"Processing player link: {player_link}, season: {season}")
-        time.sleep(5)
 
     except Exception as e:
-        # Print error and retry after 10 seconds
         print(f"Error encountered while fetching {url}: {e}")
 
     return log
 
-def fetch_player_list(last_initial: str):
+async def get_player_gamelogs_async(player_name: str, player_link: str, seasons: List[str],
+                                    session: Optional[aiohttp.ClientSession] = None) -> List[List[dict]]:
+    """
+    Fetches player game logs from Basketball Reference for several seasons concurrently, keeping at most
+    MAX_CONCURRENT_REQUESTS requests in flight.
+
+    Args:
+        player_name (str): The player's name.
+        player_link (str): The player's link on Basketball Reference.
+        seasons (List[str]): The seasons to fetch game logs for.
+        session (Optional[aiohttp.ClientSession], optional): The HTTP session to reuse. Defaults to a new session.
+
+    Returns:
+        List[List[dict]]: The game logs of each season, in the order of the given seasons.
+    """
+    async with use_client_session(session) as session:
+        return await gather_bounded(get_player_gamelog_async(session, player_name, player_link, season) for season in seasons)
+
+async def scrape_player_async(player: dict, session: Optional[aiohttp.ClientSession] = None) -> Tuple[List[dict], List[List[dict]]]:
+    """
+    Fetches the season averages and the game logs of every season of a player from Basketball Reference. The player
+    page and the game log pages are fetched concurrently over one session, keeping at most MAX_CONCURRENT_REQUESTS
+    requests in flight.
+
+    Args:
+        player (dict): The player data containing 'player', 'link', 'year_min' and 'year_max' keys.
+        session (Optional[aiohttp.ClientSession], optional): The HTTP session to reuse. Defaults to a new session.
+
+    Returns:
+        Tuple[List[dict], List[List[dict]]]: The player's season averages, and the game logs of each season from
+        'year_min' to 'year_max', in order.
+    """
+    seasons = [str(year) for year in range(int(player['year_min']), int(player['year_max']) + 1)]
+
+    async with use_client_session(session) as session:
+        averages, *season_logs = await gather_bounded([
+            get_player_averages_async(session, player['player'], player['link']),
+            *[get_player_gamelog_async(session, player['player'], player['link'], season) for season in seasons]
+        ])
+
+    return averages, season_logs
+
+def parse_player_list(tree: html.HtmlElement) -> List[dict]:
+    """
+    Extracts the players from a parsed Basketball Reference player index page.
+
+    Args:
+        tree (html.HtmlElement): The parsed player index page.
+
+    Returns:
+        players (list): A list of dictionaries containing player data.
+
+    Raises:
+        ValueError: If the page has no table, e.g. a block or error page served with a success status.
+    """
+    players = []
+
+    if not TABLE_BODIES(tree):
+        raise ValueError("no player table found on the page")
+
+    for row in TABLE_ROWS(tree):
+        stats = get_row_stats(row)
+        data = parse_player_list_row(stats, {'player': stats.get('player', ''), 'link': PLAYER_LINK(row).replace('.html', '')})
+        data['height_inches'] = convert_height_to_inches(data['height']) if data['height'] else None
+
+        # Try to get the college link if the row has a colleges cell
+        if 'colleges' in stats:
+            college_links = COLLEGE_LINKS(row)
+            if college_links:
+                data['college_link'] = college_links[0]
+            else:
+                print(f"College link not found for {data['player']}")
+
+        players.append(data)
+
+    return players
+
+def fetch_player_list(last_initial: str) -> List[dict]:
     """
     Fetches the list of players whose last names start with the specified initial from Basketball Reference.
-    Retries on failure.
+    Results are cached for CACHE_MAX_AGE seconds.
 
     Args:
         last_initial (str): The first letter of the players' last names.
@@ -205,43 +758,59 @@ def fetch_player_list(last_initial: str):
     Returns:
         players (list): A list of dictionaries containing player data.
     """
-    url = f'https://www.basketball-reference.com/players/{last_initial.lower()}/'
-    players = []
+    last_initial = last_initial.lower()
+    url = f'https://www.basketball-reference.com/players/{last_initial}/'
+    players = PLAYER_LIST_CACHE.get(last_initial)
+    if players is not None:
+        return players
 
     try:
-        # Fetch the page and parse with BeautifulSoup
-        response = requests.get(url)
-        page_soup = get_soup(response)
-
-        # Find player table rows
-        table_rows = page_soup.find('tbody').find_all('tr')
-
-        # Extract player data
-        for row in table_rows:
-            data = {}
-            data['player'] = row.find('th', {'data-stat': 'player'}).text.encode('latin1').decode('utf-8')
-            data['link'] = row.find('a').get('href').replace('.html', '')
-            data['year_min'] = get_stat_value(row, 'year_min')
-            data['year_max'] = get_stat_value(row, 'year_max')
-            data['pos'] = get_stat_value(row, 'pos')
-            data['height'] = get_stat_value(row, 'height')
-            data['height_inches'] = convert_height_to_inches(data['height']) if data['height'] else None
-            data['weight'] = get_stat_value(row, 'weight')
-            data['birth_date'] = get_stat_value(row, 'birth_date')
-            data['colleges'] = get_stat_value(row, 'colleges')
-
-            # Try to get the college link if it exists
-            college_element = get_stat_value(row, 'colleges', is_text=False)
-            if college_element:
-                try:
-                    data['college_link'] = college_element.find('a').get('href')
-                except AttributeError:
-                    print(f"College link not found for {data['player']}")
-
-            players.append(data)
+        # Fetch the page and parse with lxml
+        players = parse_player_list(fetch_tree(url))
+        PLAYER_LIST_CACHE.set(last_initial, players)
+    except Exception as e:
+        print(f"Error encountered while fetching {url}: {e}")
+        players = []
+
+    return players
+
+async def fetch_player_list_async(session: aiohttp.ClientSession, last_initial: str) -> List[dict]:
+    """
+    Fetches the list of players whose last names start with the specified initial from Basketball Reference without
+    blocking the event loop. Results are cached for CACHE_MAX_AGE seconds.
 
+    Args:
+        session (aiohttp.ClientSession): The HTTP session used to fetch the page.
+        last_initial (str): The first letter of the players' last names.
+
+    Returns:
+        players (list): A list of dictionaries containing player data.
+    """
+    last_initial = last_initial.lower()
+    url = f'https://www.basketball-reference.com/players/{last_initial}/'
+    players = PLAYER_LIST_CACHE.get(last_initial)
+    if players is not None:
+        return players
+
+    try:
+        players = parse_player_list(await fetch_tree_async(session, url))
+        PLAYER_LIST_CACHE.set(last_initial, players)
     except Exception as e:
-        # Print error and retry after 10 seconds
-            print(f"Error encountered while fetching {url}: {e}")
+        print(f"Error encountered while fetching {url}: {e}")
+        players = []
 
     return players
+
+async def fetch_player_lists_async(last_initials: List[str], session: Optional[aiohttp.ClientSession] = None) -> List[List[dict]]:
+    """
+    Fetches the player lists of several last name initials from Basketball Reference concurrently.
+
+    Args:
+        last_initials (List[str]): The first letters of the players' last names.
+        session (Optional[aiohttp.ClientSession], optional): The HTTP session to reuse. Defaults to a new session.
+
+    Returns:
+        List[List[dict]]: The players of each initial, in the order of the given initials.
+    """
+    async with use_client_session(session) as session:
+        return await gather_bounded(fetch_player_list_async(session, last_initial) for last_initial in last_initials)